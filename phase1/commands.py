@@ -20,6 +20,19 @@ except ImportError:
     from phase1.models import CATEGORIES
 
 
+# Category selection menu, built once since CATEGORIES is fixed
+_CATEGORY_MENU = "\n".join(f"  {i}. {category}" for i, category in enumerate(CATEGORIES, 1))
+
+# Full "current category + menu" block for the update flow, per category
+_UPDATE_CATEGORY_TEMPLATE = (
+    "Current category: {}\n"
+    "Select new category (press Enter to keep current):\n"
+) + _CATEGORY_MENU
+_UPDATE_CATEGORY_PROMPTS = {
+    category: _UPDATE_CATEGORY_TEMPLATE.format(category) for category in CATEGORIES
+}
+
+
 def handle_help(storage: TaskStorage) -> None:
     """
     Display help message.
@@ -99,8 +112,7 @@ def prompt_category() -> str:
     """
     while True:
         print("Select category:")
-        for i, category in enumerate(CATEGORIES, 1):
-            print(f"  {i}. {category}")
+        print(_CATEGORY_MENU)
 
         choice = input("Enter choice (1-4): ").strip()
 
@@ -186,9 +198,10 @@ def handle_add(storage: TaskStorage) -> None:
     # Get task data from user
     task_data = prompt_for_task_data()
 
-    # Add auto-generated fields
-    task_data["created_at"] = datetime.now()
-    task_data["updated_at"] = datetime.now()
+    # Add auto-generated fields (one timestamp so created_at == updated_at)
+    now = datetime.now()
+    task_data["created_at"] = now
+    task_data["updated_at"] = now
     task_data["completed"] = False
 
     # Add to storage
@@ -197,6 +210,22 @@ def handle_add(storage: TaskStorage) -> None:
     print(f"\nTask added successfully! (ID: {task_id})")
 
 
+def _update_category_prompt(current_category: str) -> str:
+    """
+    Get the update-flow category prompt for the task's current category.
+
+    Args:
+        current_category: The task's current category name
+
+    Returns:
+        Prompt text including the category menu
+    """
+    prompt = _UPDATE_CATEGORY_PROMPTS.get(current_category)
+    if prompt is None:
+        prompt = _UPDATE_CATEGORY_TEMPLATE.format(current_category)
+    return prompt
+
+
 def prompt_for_update_data(current_task: dict) -> dict:
     """
     Prompt user for updated task fields, allowing them to keep current values.
@@ -227,10 +256,7 @@ def prompt_for_update_data(current_task: dict) -> dict:
         updates["description"] = new_desc
 
     # Prompt for category
-    print(f"Current category: {current_task['category']}")
-    print("Select new category (press Enter to keep current):")
-    for i, category in enumerate(CATEGORIES, 1):
-        print(f"  {i}. {category}")
+    print(_update_category_prompt(current_task["category"]))
     choice = input("Enter choice (1-4) or press Enter: ").strip()
     if choice:
         is_valid, category = validate_category(choice)
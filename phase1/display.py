@@ -5,8 +5,46 @@ This module handles all console output including banners,
 help text, task tables, and detail views.
 """
 
+import io
+import sys
+from functools import lru_cache
 from datetime import datetime
-from typing import List, Optional
+from typing import Collection, Optional
+
+
+# Task table header, built once
+_HEADER = (
+    "ID | Status | Category | Title                          | Masjid           | Area         | Due Date/Time\n"
+    "---|--------|----------|--------------------------------|------------------|--------------|------------------\n"
+)
+
+# Task table row format, specialized for the fixed column layout so each
+# row is padded by a single C-level str.__mod__ call
+_ROW_FMT = "%-2s | %-6s | %-8s | %-30s | %-16s | %-12s | %s\n"
+
+
+class OutputBuffer:
+    """
+    Collect everything printed inside the block and write it out once.
+
+    Only for non-interactive commands: prompts printed while buffering
+    would not reach the terminal before input() blocks.
+
+    Usage:
+        with OutputBuffer():
+            show_task_table(tasks)
+    """
+
+    def __enter__(self) -> "OutputBuffer":
+        self._stdout = sys.stdout
+        self._buffer = io.StringIO()
+        sys.stdout = self._buffer
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        sys.stdout = self._stdout
+        self._stdout.write(self._buffer.getvalue())
+        return False
 
 
 def show_welcome_banner() -> None:
@@ -57,53 +95,60 @@ def format_datetime(dt: Optional[datetime]) -> str:
     """
     if dt is None:
         return "-"
+    return _format_datetime_cached(dt)
+
+
+@lru_cache(maxsize=256)
+def _format_datetime_cached(dt: datetime) -> str:
+    """strftime is slow; tables often repeat the same timestamps."""
     return dt.strftime("%Y-%m-%d %H:%M")
 
 
-def show_task_table(tasks: List[dict]) -> None:
+def _fit(text: str, width: int) -> str:
+    """
+    Truncate text to a column width, marking the cut with "...".
+
+    Args:
+        text: String to fit
+        width: Maximum column width
+
+    Returns:
+        The text unchanged if it fits, otherwise shortened with "..."
+    """
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
+def show_task_table(tasks: Collection[dict]) -> None:
     """
     Display tasks in a formatted table.
 
     Args:
-        tasks: List of task dictionaries to display
+        tasks: Task dictionaries to display
     """
     if not tasks:
         print("No tasks found.")
         return
 
-    # Print header
-    print("ID | Status | Category | Title                          | Masjid           | Area         | Due Date/Time")
-    print("---|--------|----------|--------------------------------|------------------|--------------|------------------")
-
-    # Print each task
-    for task in tasks:
-        task_id = str(task["id"])
-        status = format_status(task["completed"])
-        category = task["category"]
-
-        # Truncate title if too long
-        title = task["title"]
-        if len(title) > 30:
-            title = title[:27] + "..."
+    # Truncate long fields; optional fields fall back to "-"
+    rows = "".join(
+        _ROW_FMT % (
+            task["id"],
+            format_status(task["completed"]),
+            task["category"],
+            _fit(task["title"], 30),
+            _fit(task.get("masjid_name", "") or "-", 16),
+            _fit(task.get("area_name", "") or "-", 12),
+            format_datetime(task.get("due_datetime")),
+        )
+        for task in tasks
+    )
 
-        # Handle optional fields
-        masjid = task.get("masjid_name", "") or "-"
-        if len(masjid) > 16:
-            masjid = masjid[:13] + "..."
-
-        area = task.get("area_name", "") or "-"
-        if len(area) > 12:
-            area = area[:9] + "..."
-
-        due = format_datetime(task.get("due_datetime"))
-
-        # Print row with proper spacing
-        print(f"{task_id:2} | {status:6} | {category:8} | {title:30} | {masjid:16} | {area:12} | {due}")
-
-    # Print summary
     completed_count = sum(1 for task in tasks if task["completed"])
     pending_count = len(tasks) - completed_count
-    print(f"\nTotal: {len(tasks)} tasks ({completed_count} completed, {pending_count} pending)")
+    summary = f"\nTotal: {len(tasks)} tasks ({completed_count} completed, {pending_count} pending)\n"
+
+    # One write for the whole table instead of a print() per row
+    sys.stdout.write(_HEADER + rows + summary)
 
 
 def show_task_detail(task: dict) -> None:
@@ -113,16 +158,16 @@ def show_task_detail(task: dict) -> None:
     Args:
         task: Task dictionary to display
     """
-    print(f"Task ID: {task['id']}")
-    print(f"Title: {task['title']}")
-    print(f"Description: {task.get('description', '') or '-'}")
-    print(f"Category: {task['category']}")
-    print(f"Masjid: {task.get('masjid_name', '') or '-'}")
-    print(f"Area: {task.get('area_name', '') or '-'}")
-    print(f"Due Date/Time: {format_datetime(task.get('due_datetime'))}")
-
     status = "Completed" if task["completed"] else "Pending"
-    print(f"Status: {status}")
-
-    print(f"Created: {format_datetime(task['created_at'])}")
-    print(f"Last Updated: {format_datetime(task['updated_at'])}")
+    print("\n".join([
+        f"Task ID: {task['id']}",
+        f"Title: {task['title']}",
+        f"Description: {task.get('description', '') or '-'}",
+        f"Category: {task['category']}",
+        f"Masjid: {task.get('masjid_name', '') or '-'}",
+        f"Area: {task.get('area_name', '') or '-'}",
+        f"Due Date/Time: {format_datetime(task.get('due_datetime'))}",
+        f"Status: {status}",
+        f"Created: {format_datetime(task['created_at'])}",
+        f"Last Updated: {format_datetime(task['updated_at'])}",
+    ]))
@@ -5,24 +5,68 @@ Phase I: In-Memory Python Console Application
 Main entry point for the application.
 """
 
-from typing import List
+import sys
+from typing import Callable, List
 
 try:
     from storage import TaskStorage
-    from display import show_welcome_banner, show_help
+    from display import OutputBuffer, show_welcome_banner, show_help
     from commands import (
         handle_help, handle_add, handle_list, handle_view,
         handle_update, handle_delete, handle_complete, handle_uncomplete
     )
 except ImportError:
     from phase1.storage import TaskStorage
-    from phase1.display import show_welcome_banner, show_help
+    from phase1.display import OutputBuffer, show_welcome_banner, show_help
     from phase1.commands import (
         handle_help, handle_add, handle_list, handle_view,
         handle_update, handle_delete, handle_complete, handle_uncomplete
     )
 
 
+# Command dispatch table: name -> (handler, takes_args)
+_HANDLERS = {
+    "help": (handle_help, False),
+    "add": (handle_add, False),
+    "list": (handle_list, True),
+    "view": (handle_view, True),
+    "update": (handle_update, True),
+    "delete": (handle_delete, True),
+    "complete": (handle_complete, True),
+    "uncomplete": (handle_uncomplete, True),
+}
+
+# Commands that prompt for input and so must not have their output buffered
+_INTERACTIVE_COMMANDS = frozenset({"add", "update", "delete"})
+
+
+_PROMPT = "salaatflow> "
+
+
+def _read_line(prompt: str) -> str:
+    """
+    Read one line from non-interactive stdin, mirroring input().
+
+    Skips input()'s readline/tty handling, which is pure overhead for
+    piped or scripted sessions.
+
+    Args:
+        prompt: Prompt text to write before reading
+
+    Returns:
+        The line read, without its trailing newline
+
+    Raises:
+        EOFError: If stdin is exhausted (same as input())
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
 def parse_command(user_input: str) -> tuple[str, List[str]]:
     """
     Parse user input into command and arguments.
@@ -59,26 +103,19 @@ def dispatch_command(cmd: str, args: List[str], storage: TaskStorage) -> bool:
         # Empty command, just continue
         return True
 
-    if cmd == "help":
-        handle_help(storage)
-    elif cmd == "add":
-        handle_add(storage)
-    elif cmd == "list":
-        handle_list(storage, args)
-    elif cmd == "view":
-        handle_view(storage, args)
-    elif cmd == "update":
-        handle_update(storage, args)
-    elif cmd == "delete":
-        handle_delete(storage, args)
-    elif cmd == "complete":
-        handle_complete(storage, args)
-    elif cmd == "uncomplete":
-        handle_uncomplete(storage, args)
-    elif cmd == "exit":
+    if cmd == "exit":
         return False  # Signal to exit
-    else:
+
+    entry = _HANDLERS.get(cmd)
+    if entry is None:
         print(f"Error: Unknown command '{cmd}'. Type 'help' for available commands.")
+        return True
+
+    handler, takes_args = entry
+    if takes_args:
+        handler(storage, args)
+    else:
+        handler(storage)
 
     return True  # Continue loop
 
@@ -94,17 +131,24 @@ def main() -> None:
     show_help()
     print()
 
+    # Use input() for terminals, a plain readline for piped input
+    read_line: Callable[[str], str] = input if sys.stdin.isatty() else _read_line
+
     # Main REPL loop
     try:
         while True:
             # Display prompt
-            user_input = input("salaatflow> ")
+            user_input = read_line(_PROMPT)
 
             # Parse command
             cmd, args = parse_command(user_input)
 
-            # Dispatch command
-            should_continue = dispatch_command(cmd, args, storage)
+            # Dispatch command (non-interactive output is written in one go)
+            if cmd in _INTERACTIVE_COMMANDS:
+                should_continue = dispatch_command(cmd, args, storage)
+            else:
+                with OutputBuffer():
+                    should_continue = dispatch_command(cmd, args, storage)
 
             if not should_continue:
                 break
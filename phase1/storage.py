@@ -5,21 +5,44 @@ This module provides the TaskStorage class for CRUD operations
 on tasks stored in memory (not persisted to disk).
 """
 
-from typing import List, Optional
+from typing import Dict, Optional, ValuesView
 
 
 class TaskStorage:
     """
     In-memory storage for spiritual tasks.
 
-    Manages a list of task dictionaries with auto-incrementing IDs.
+    Manages task dictionaries keyed by auto-incrementing ID (insertion
+    ordered, so iteration follows ID order), plus pending/completed
+    partitions so filtered listings never scan the full task list.
     """
 
     def __init__(self):
         """Initialize empty storage."""
-        self.tasks: List[dict] = []
+        self.tasks: Dict[int, dict] = {}
+        # Partitions keyed by completion state, each kept in ID order
+        self._partitions: Dict[bool, Dict[int, dict]] = {False: {}, True: {}}
         self.next_id: int = 1
 
+    def _place(self, task: dict) -> None:
+        """
+        Insert a task into the partition matching its completion state.
+
+        Args:
+            task: Task dictionary (with ID)
+        """
+        partition = self._partitions[bool(task["completed"])]
+        task_id = task["id"]
+        in_order = not partition or task_id > next(reversed(partition))
+        partition[task_id] = task
+
+        # New tasks always carry the highest ID; only a moved task can land
+        # out of order, in which case the partition is re-sorted once here.
+        if not in_order:
+            ordered = sorted(partition.items())
+            partition.clear()
+            partition.update(ordered)
+
     def add_task(self, task: dict) -> int:
         """
         Add a new task to storage.
@@ -31,8 +54,9 @@ class TaskStorage:
             The assigned task ID
         """
         task["id"] = self.next_id
-        self.tasks.append(task)
         assigned_id = self.next_id
+        self.tasks[assigned_id] = task
+        self._place(task)
         self.next_id += 1
         return assigned_id
 
@@ -46,10 +70,7 @@ class TaskStorage:
         Returns:
             Task dictionary if found, None otherwise
         """
-        for task in self.tasks:
-            if task["id"] == task_id:
-                return task
-        return None
+        return self.tasks.get(task_id)
 
     def update_task(self, task_id: int, updates: dict) -> bool:
         """
@@ -66,10 +87,17 @@ class TaskStorage:
         if task is None:
             return False
 
+        was_completed = bool(task["completed"])
+
         # Update fields
         for key, value in updates.items():
             task[key] = value
 
+        # Move between partitions on a completion state change
+        if bool(task["completed"]) != was_completed:
+            del self._partitions[was_completed][task_id]
+            self._place(task)
+
         return True
 
     def delete_task(self, task_id: int) -> bool:
@@ -82,27 +110,29 @@ class TaskStorage:
         Returns:
             True if task found and deleted, False otherwise
         """
-        for i, task in enumerate(self.tasks):
-            if task["id"] == task_id:
-                self.tasks.pop(i)
-                return True
-        return False
+        task = self.tasks.pop(task_id, None)
+        if task is None:
+            return False
 
-    def list_tasks(self, filter: str = "all") -> List[dict]:
+        del self._partitions[bool(task["completed"])][task_id]
+        return True
+
+    def list_tasks(self, filter: str = "all") -> ValuesView[dict]:
         """
         List tasks with optional filtering.
 
+        Returns a live, read-only view rather than a copy; callers that need
+        to add or delete tasks while iterating should take list(...) first.
+
         Args:
             filter: Filter type - "all", "pending", or "completed"
 
         Returns:
-            List of task dictionaries matching the filter
+            View of task dictionaries matching the filter
         """
-        if filter == "all":
-            return self.tasks.copy()
-        elif filter == "pending":
-            return [task for task in self.tasks if not task["completed"]]
+        if filter == "pending":
+            return self._partitions[False].values()
         elif filter == "completed":
-            return [task for task in self.tasks if task["completed"]]
+            return self._partitions[True].values()
         else:
-            return self.tasks.copy()  # Default to all if invalid filter
+            return self.tasks.values()  # "all", and default if invalid filter
@@ -21,6 +21,10 @@ MAX_DESCRIPTION_LENGTH = 1000
 MAX_MASJID_NAME_LENGTH = 100
 MAX_AREA_NAME_LENGTH = 100
 DATETIME_FORMAT = "YYYY-MM-DD HH:MM"
+_STRPTIME_FORMAT = "%Y-%m-%d %H:%M"
+
+# Valid menu choices ("1" -> Farz, ..., "4" -> Deed)
+_VALID_CATEGORY_CHOICES = frozenset(str(i) for i in range(1, len(CATEGORIES) + 1))
 
 
 def validate_title(title: str) -> tuple[bool, str]:
@@ -28,14 +32,14 @@ def validate_title(title: str) -> tuple[bool, str]:
     Validate task title.
 
     Args:
-        title: The title string to validate
+        title: The title string to validate (already stripped by the caller)
 
     Returns:
         Tuple of (is_valid, error_message)
         - (True, "") if valid
         - (False, error_message) if invalid
     """
-    if not title or len(title.strip()) == 0:
+    if not title:
         return (False, "Title cannot be empty")
 
     if len(title) > MAX_TITLE_LENGTH:
@@ -56,37 +60,59 @@ def validate_category(choice: str) -> tuple[bool, str]:
         - (True, category_name) if valid choice
         - (False, "") if invalid
     """
-    category_map = {
-        "1": CATEGORIES[0],  # Farz
-        "2": CATEGORIES[1],  # Sunnah
-        "3": CATEGORIES[2],  # Nafl
-        "4": CATEGORIES[3],  # Deed
-    }
-
-    if choice in category_map:
-        return (True, category_map[choice])
+    if choice in _VALID_CATEGORY_CHOICES:
+        return (True, CATEGORIES[int(choice) - 1])
 
     return (False, "")
 
 
+def _is_canonical_datetime(datetime_str: str) -> bool:
+    """
+    Check whether a string has the exact zero-padded YYYY-MM-DD HH:MM shape.
+
+    Args:
+        datetime_str: Stripped datetime string
+
+    Returns:
+        True if separators sit at their fixed positions, False otherwise
+    """
+    return (
+        len(datetime_str) == 16
+        and datetime_str[4] == "-"
+        and datetime_str[7] == "-"
+        and datetime_str[10] == " "
+        and datetime_str[13] == ":"
+    )
+
+
 def validate_datetime(datetime_str: str) -> tuple[bool, Optional[datetime]]:
     """
     Validate datetime string in format YYYY-MM-DD HH:MM.
 
+    Callers strip user input once at the prompt, so no re-stripping here.
+
     Args:
-        datetime_str: The datetime string to parse
+        datetime_str: The datetime string to parse (already stripped by the caller)
 
     Returns:
         Tuple of (is_valid, datetime_object)
         - (True, datetime_obj) if valid
         - (False, None) if invalid
     """
-    if not datetime_str or len(datetime_str.strip()) == 0:
+    if not datetime_str:
         return (True, None)  # Empty is valid (optional field)
 
+    # Fast path: canonical zero-padded YYYY-MM-DD HH:MM goes through the
+    # C-level ISO parser instead of the much slower _strptime machinery
+    if _is_canonical_datetime(datetime_str):
+        try:
+            return (True, datetime.fromisoformat(datetime_str))
+        except ValueError:
+            pass  # Let strptime decide, it is more lenient with whitespace
+
     try:
-        # Parse format: YYYY-MM-DD HH:MM
-        dt = datetime.strptime(datetime_str.strip(), "%Y-%m-%d %H:%M")
+        # Parse format: YYYY-MM-DD HH:MM (also accepts unpadded fields)
+        dt = datetime.strptime(datetime_str, _STRPTIME_FORMAT)
         return (True, dt)
     except ValueError:
         return (False, None)
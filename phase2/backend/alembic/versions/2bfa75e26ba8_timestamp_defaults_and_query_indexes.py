@@ -0,0 +1,143 @@
+"""Timestamp server defaults and query indexes
+
+Brings databases created by earlier versions of create_db_and_tables() up
+to date with models.py: created_at/updated_at get their server defaults
+(daily_hadith gains updated_at, which its ETags are built from), and the
+indexes behind list sorting, keyset pagination, upcoming/overdue
+and trigram search are created. Tables that don't exist yet are skipped,
+as create_db_and_tables() creates them complete, and every index is
+created only if missing, so this is safe on a database of either age.
+
+Revision ID: 2bfa75e26ba8
+Revises:
+Create Date: 2026-10-15 23:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2bfa75e26ba8'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Server-managed timestamp columns, by table
+TIMESTAMP_COLUMNS = {
+    "spiritual_tasks": ("created_at", "updated_at"),
+    "masjids": ("created_at", "updated_at"),
+    "daily_hadith": ("created_at", "updated_at"),
+}
+
+# Timestamp columns this revision adds rather than alters: (table, column)
+ADDED_COLUMNS = {("daily_hadith", "updated_at")}
+
+# Trigram search indexes (PostgreSQL only): (name, table, column)
+TRIGRAM_INDEXES = (
+    ("ix_spiritual_tasks_title_trgm", "spiritual_tasks", "title"),
+    ("ix_spiritual_tasks_description_trgm", "spiritual_tasks", "description"),
+    ("ix_masjids_name_trgm", "masjids", "name"),
+    ("ix_masjids_area_trgm", "masjids", "area"),
+)
+
+
+def _utcnow(dialect_name: str) -> sa.TextClause:
+    """Current UTC time as a naive timestamp, as models.utcnow compiles it"""
+    if dialect_name == "postgresql":
+        return sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+    if dialect_name == "sqlite":
+        return sa.text("(STRFTIME('%Y-%m-%d %H:%M:%f000', 'now'))")
+    return sa.text("CURRENT_TIMESTAMP")
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    dialect_name = bind.dialect.name
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    # Timestamp defaults (SQLite can't alter a column, so batch mode rebuilds the table)
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        if table not in tables:
+            continue
+        existing = {column["name"] for column in inspector.get_columns(table)}
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                if column not in existing:
+                    # Existing rows take the migration time
+                    batch_op.add_column(sa.Column(
+                        column, sa.DateTime(), nullable=False,
+                        server_default=_utcnow(dialect_name),
+                    ))
+                    continue
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    existing_nullable=False,
+                    server_default=_utcnow(dialect_name),
+                )
+
+    if "spiritual_tasks" in tables:
+        op.create_index(
+            "ix_spiritual_tasks_created_at", "spiritual_tasks", ["created_at", "id"],
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_spiritual_tasks_masjid_created", "spiritual_tasks", ["masjid_id", "created_at"],
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_spiritual_tasks_open_due", "spiritual_tasks", ["due_datetime"],
+            postgresql_where=sa.text("completed = false"),
+            sqlite_where=sa.text("completed = 0"),
+            if_not_exists=True,
+        )
+
+    if dialect_name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for name, table, column in TRIGRAM_INDEXES:
+            if table in tables:
+                op.create_index(
+                    name, table, [column],
+                    postgresql_using="gin",
+                    postgresql_ops={column: "gin_trgm_ops"},
+                    if_not_exists=True,
+                )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    dialect_name = bind.dialect.name
+    tables = set(sa.inspect(bind).get_table_names())
+
+    if dialect_name == "postgresql":
+        for name, table, _ in TRIGRAM_INDEXES:
+            if table in tables:
+                op.drop_index(name, table_name=table, if_exists=True)
+
+    if "spiritual_tasks" in tables:
+        for name in (
+            "ix_spiritual_tasks_open_due",
+            "ix_spiritual_tasks_masjid_created",
+            "ix_spiritual_tasks_created_at",
+        ):
+            op.drop_index(name, table_name="spiritual_tasks", if_exists=True)
+
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        if table not in tables:
+            continue
+        with op.batch_alter_table(table) as batch_op:
+            for column in columns:
+                if (table, column) in ADDED_COLUMNS:
+                    batch_op.drop_column(column)
+                    continue
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    existing_nullable=False,
+                    server_default=None,
+                )
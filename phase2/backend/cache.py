@@ -0,0 +1,180 @@
+"""
+SalaatFlow Phase II - Response Caching
+
+Small in-process TTL caches for read-heavy endpoints.
+Writes clear the affected cache; the TTL bounds how stale other worker
+processes can get, since each process keeps its own copy.
+"""
+
+import asyncio
+from time import monotonic
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+# ============================================================================
+# TTL Cache
+# ============================================================================
+
+class TTLCache:
+    """
+    Dictionary cache whose entries expire after a fixed time.
+
+    Entries are keyed by any hashable value (typically the endpoint name
+    plus its query parameters). When full, the cache is simply emptied.
+
+    A read that may overlap a write captures ``generation`` before querying
+    and passes it to set(); if the cache was cleared meanwhile, the result
+    predates the write and is not stored.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 256):
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttl: Default entry lifetime in seconds
+            max_entries: Entry count at which the cache is emptied
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Number of times the cache has been cleared."""
+        return self._generation
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Look up a live entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= monotonic():
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Store a value, unless the cache was cleared since it was computed.
+
+        Args:
+            key: Cache key
+            value: Value to cache (never None)
+            ttl: Lifetime in seconds, overriding the cache default
+            generation: ``generation`` read before computing the value
+        """
+        if generation is not None and generation != self._generation:
+            return
+        if len(self._entries) >= self.max_entries and key not in self._entries:
+            self._entries.clear()
+        self._entries[key] = (monotonic() + (ttl or self.ttl), value)
+
+    def clear(self) -> None:
+        """Drop every entry (call after any write the cached reads depend on)."""
+        self._entries.clear()
+        self._generation += 1
+
+
+# ============================================================================
+# Stale-While-Revalidate Value
+# ============================================================================
+
+class StaleWhileRevalidate:
+    """
+    A single cached value that keeps being served while it is recomputed.
+
+    Once the value is older than its freshness window, or has been
+    invalidated, the next read still returns it immediately and starts one
+    background recompute that concurrent readers share. Only a read with
+    nothing cached yet waits for the result.
+    """
+
+    def __init__(self, fresh_for: float):
+        """
+        Initialize with no value.
+
+        Args:
+            fresh_for: Seconds a computed value counts as fresh
+        """
+        self.fresh_for = fresh_for
+        self._value: Optional[Any] = None
+        self._fresh_until = 0.0
+        self._generation = 0
+        self._refresh: Optional[asyncio.Task] = None
+
+    def invalidate(self) -> None:
+        """Mark the value stale (call after any write it depends on)."""
+        self._fresh_until = 0.0
+        self._generation += 1
+
+    async def get(self, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value, refreshing it if it is stale.
+
+        Args:
+            compute: Coroutine function producing a new value; it runs in the
+                background, so it must not use the caller's database session
+
+        Returns:
+            The cached value (possibly stale), or a freshly computed one if
+            nothing was cached yet
+        """
+        if self._value is not None and self._fresh_until > monotonic():
+            return self._value
+
+        if self._refresh is None:
+            self._refresh = asyncio.ensure_future(self._recompute(compute))
+            self._refresh.add_done_callback(self._refresh_done)
+
+        if self._value is None:
+            # Shielded so one client disconnecting doesn't cancel the others' wait
+            return await asyncio.shield(self._refresh)
+        return self._value
+
+    async def _recompute(self, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Compute and store a new value, fresh unless invalidated meanwhile."""
+        generation = self._generation
+        value = await compute()
+        self._value = value
+        if generation == self._generation:
+            self._fresh_until = monotonic() + self.fresh_for
+        return value
+
+    def _refresh_done(self, task: asyncio.Task) -> None:
+        """Clear the finished refresh; a failure just leaves the value stale."""
+        self._refresh = None
+        if not task.cancelled():
+            task.exception()  # Mark retrieved; the next stale read retries
+
+
+# ============================================================================
+# Shared Caches
+# ============================================================================
+
+# Task reads (list, search); cleared by every write to tasks
+task_cache = TTLCache(ttl=60)
+
+# Task statistics; marked stale by every write to tasks
+task_stats = StaleWhileRevalidate(fresh_for=300)
+
+
+def invalidate_tasks() -> None:
+    """Drop cached task reads and mark the task statistics stale."""
+    task_cache.clear()
+    task_stats.invalidate()
@@ -5,6 +5,7 @@ Environment-based configuration using Pydantic Settings.
 Loads configuration from .env file and environment variables.
 """
 
+from functools import cached_property, lru_cache
 from pydantic_settings import BaseSettings
 from typing import List
 import os
@@ -20,6 +21,10 @@ class Settings(BaseSettings):
 
     # Database Configuration
     database_url: str = ""
+    db_pool_size: int = 20  # Persistent connections per process (ignored when serverless)
+    db_max_overflow: int = 10  # Extra connections allowed during bursts
+    db_pool_timeout: int = 30  # Seconds to wait for a free connection before failing
+    db_query_cache_size: int = 5000  # Compiled statements kept (list_tasks filters make many shapes)
 
     # CORS Configuration
     cors_origins: str = "http://localhost:3000,http://127.0.0.1:3000"
@@ -43,17 +48,19 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
         case_sensitive = False
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
         """
         Parse CORS origins from comma-separated string to list.
 
+        Parsed once on first access and cached on the instance.
+
         Returns:
             List[str]: List of allowed CORS origins
         """
         return [origin.strip() for origin in self.cors_origins.split(",") if origin.strip()]
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """
         Check if running in production environment.
@@ -64,13 +71,31 @@ class Settings(BaseSettings):
         return self.environment.lower() == "production"
 
 
-# Global settings instance
-settings = Settings()
+# ============================================================================
+# Settings Factory
+# ============================================================================
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Build and validate the application settings on first use.
+
+    Construction (env/.env parsing) is deferred until something actually
+    needs the settings, so importing this module stays cheap.
+
+    Returns:
+        Settings: Cached application settings instance
+
+    Raises:
+        ValueError: If DATABASE_URL is not configured
+    """
+    settings = Settings()
 
+    # Validate critical settings
+    if not settings.database_url:
+        raise ValueError(
+            "DATABASE_URL is not set. Please create a .env file with your database connection string.\n"
+            "Copy .env.example to .env and fill in your Neon PostgreSQL credentials."
+        )
 
-# Validate critical settings
-if not settings.database_url:
-    raise ValueError(
-        "DATABASE_URL is not set. Please create a .env file with your database connection string.\n"
-        "Copy .env.example to .env and fill in your Neon PostgreSQL credentials."
-    )
+    return settings
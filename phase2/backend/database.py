@@ -2,69 +2,195 @@
 SalaatFlow Phase II - Database Configuration
 
 Database connection, session management, and dependency injection for FastAPI.
-Uses SQLModel with PostgreSQL (Neon).
+Uses SQLModel with PostgreSQL (Neon) through the asyncpg driver, so database
+calls never block the event loop.
 """
 
-from typing import Generator
-from sqlmodel import SQLModel, create_engine, Session
-from sqlalchemy.pool import NullPool
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Tuple
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import event, text
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 import os
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+from config import get_settings
 
 
 # ============================================================================
 # Database Configuration
 # ============================================================================
 
-# Get database URL from environment
-DATABASE_URL = os.getenv("DATABASE_URL")
+# Environments where connection pooling is disabled
+SERVERLESS_ENVIRONMENTS = frozenset({"serverless", "lambda"})
+
+# libpq-only URL parameters that asyncpg does not understand
+_LIBPQ_ONLY_PARAMS = ("sslmode", "channel_binding")
+
+# Per-connection tuning by backend, applied once per physical connection
+_CONNECT_STATEMENTS = {
+    "postgresql": (
+        "SET jit = off",  # JIT compile time outweighs any gain on short CRUD queries
+    ),
+    "sqlite": (  # Local development databases
+        "PRAGMA journal_mode=WAL",  # Readers no longer block the writer
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA mmap_size=268435456",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA foreign_keys=ON",
+    ),
+}
+
+
+def _to_async_url(database_url: str) -> Tuple[URL, dict]:
+    """
+    Convert a database URL into one for an async driver.
+
+    Neon connection strings look like postgresql://...?sslmode=require, which
+    asyncpg rejects; the sslmode is moved into asyncpg's ``ssl`` argument.
+    Plain sqlite:// URLs (local development) are pointed at aiosqlite. Other
+    URLs, including ones that already name a driver, are returned unchanged.
+
+    Args:
+        database_url: Connection string from DATABASE_URL
+
+    Returns:
+        Tuple of (async URL, connect_args for the driver)
+    """
+    url = make_url(database_url)
+    connect_args = {}
+
+    if url.drivername == "sqlite":
+        return url.set(drivername="sqlite+aiosqlite"), connect_args
+
+    if url.get_backend_name() != "postgresql":
+        return url, connect_args
+
+    sslmode = url.query.get("sslmode")
+    if sslmode:
+        connect_args["ssl"] = sslmode
+
+    url = url.set(drivername="postgresql+asyncpg").difference_update_query(_LIBPQ_ONLY_PARAMS)
+    return url, connect_args
+
+
+@lru_cache
+def get_engine() -> AsyncEngine:
+    """
+    Create the async database engine on first use.
+
+    Loading .env and building the engine are deferred until a session is
+    actually needed, so importing this module stays cheap.
+
+    Returns:
+        AsyncEngine: Cached SQLAlchemy async engine
+
+    Raises:
+        ValueError: If DATABASE_URL is not set
+    """
+    from dotenv import load_dotenv
+    from sqlalchemy.pool import NullPool
+
+    # Load environment variables
+    load_dotenv()
+
+    # Get database URL from environment
+    database_url = os.getenv("DATABASE_URL")
+
+    if not database_url:
+        raise ValueError(
+            "DATABASE_URL environment variable is not set. "
+            "Please create a .env file with your Neon PostgreSQL connection string."
+        )
+
+    url, connect_args = _to_async_url(database_url)
+
+    settings = get_settings()
+    engine_kwargs = {
+        "echo": settings.debug and not settings.is_production,  # Log SQL only while debugging
+        "connect_args": connect_args,
+        "query_cache_size": settings.db_query_cache_size,
+    }
+
+    if settings.environment.lower() in SERVERLESS_ENVIRONMENTS:
+        # Serverless: connections don't outlive the invocation, so don't pool
+        engine_kwargs["poolclass"] = NullPool
+    else:
+        # Long-running server: reuse connections instead of paying TCP+TLS+auth per request
+        engine_kwargs["pool_size"] = settings.db_pool_size
+        engine_kwargs["max_overflow"] = settings.db_max_overflow
+        engine_kwargs["pool_timeout"] = settings.db_pool_timeout
+        engine_kwargs["pool_pre_ping"] = True  # Replace connections the server closed while idle
+        engine_kwargs["pool_recycle"] = 3600
+
+    engine = create_async_engine(url, **engine_kwargs)
+
+    statements = _CONNECT_STATEMENTS.get(url.get_backend_name())
+    if statements:
+        @event.listens_for(engine.sync_engine, "connect")
+        def _tune_connection(dbapi_connection, connection_record) -> None:
+            cursor = dbapi_connection.cursor()
+            for statement in statements:
+                cursor.execute(statement)
+            cursor.close()
+            # Commit so the pool's reset-on-return rollback doesn't undo the settings
+            dbapi_connection.commit()
+
+    return engine
+
+
+@lru_cache
+def get_sessionmaker() -> async_sessionmaker:
+    """
+    Get the session factory bound to the async engine.
 
-if not DATABASE_URL:
-    raise ValueError(
-        "DATABASE_URL environment variable is not set. "
-        "Please create a .env file with your Neon PostgreSQL connection string."
-    )
+    Sessions don't expire attributes on commit, so objects stay readable
+    after commit without another round-trip.
 
-# Create engine with connection pooling
-# For serverless (Neon), use NullPool to avoid connection pooling issues
-engine = create_engine(
-    DATABASE_URL,
-    echo=True,  # Log SQL queries (set to False in production)
-    poolclass=NullPool,  # Disable connection pooling for serverless
-)
+    Returns:
+        async_sessionmaker: Cached factory producing AsyncSession objects
+    """
+    return async_sessionmaker(get_engine(), class_=AsyncSession, expire_on_commit=False)
 
 
 # ============================================================================
 # Database Initialization
 # ============================================================================
 
-def create_db_and_tables() -> None:
+async def create_db_and_tables() -> None:
     """
     Create all database tables based on SQLModel models.
 
     This function should be called once at application startup.
     In production, use Alembic migrations instead.
     """
-    SQLModel.metadata.create_all(engine)
+    async with get_engine().begin() as conn:
+        if conn.dialect.name == "postgresql":
+            # Trigram search indexes need the pg_trgm extension
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(SQLModel.metadata.create_all)
 
 
-def get_session() -> Generator[Session, None, None]:
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
     FastAPI dependency to get database session.
 
+    Handlers commit their own writes before returning, and FastAPI closes
+    the session before the response is sent, so a 2xx is only ever sent
+    for a durable write.
+
     Yields:
-        Session: SQLModel database session
+        AsyncSession: SQLModel async database session
 
     Usage:
         @app.get("/tasks")
-        def get_tasks(session: Session = Depends(get_session)):
-            tasks = session.exec(select(SpiritualTask)).all()
+        async def get_tasks(session: AsyncSession = Depends(get_session)):
+            tasks = (await session.exec(select(SpiritualTask))).all()
             return tasks
     """
-    with Session(engine) as session:
+    async with get_sessionmaker()() as session:
         yield session
 
 
@@ -72,15 +198,33 @@ def get_session() -> Generator[Session, None, None]:
 # Session Context Manager (for manual usage)
 # ============================================================================
 
-def get_db_session() -> Session:
+def get_db_session() -> AsyncSession:
     """
     Get a database session for manual usage (non-FastAPI contexts).
 
     Returns:
-        Session: SQLModel database session
+        AsyncSession: SQLModel async database session
 
     Usage:
-        with get_db_session() as session:
-            task = session.get(SpiritualTask, task_id)
+        async with get_db_session() as session:
+            task = await session.get(SpiritualTask, task_id)
+    """
+    return get_sessionmaker()()
+
+
+async def scalar_on_own_session(statement: Any) -> Any:
+    """
+    Run a scalar query (e.g. a COUNT) on a dedicated session.
+
+    An AsyncSession can't run two statements at once, so a query meant to
+    overlap with the request's own session (via asyncio.gather) needs its
+    own connection.
+
+    Args:
+        statement: Query returning a single value
+
+    Returns:
+        The scalar result
     """
-    return Session(engine)
+    async with get_sessionmaker()() as session:
+        return await session.scalar(statement)
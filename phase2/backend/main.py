@@ -5,12 +5,35 @@ Main application entry point for the SalaatFlow REST API.
 Provides endpoints for managing spiritual tasks, masjids, and daily hadith.
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
+from pydantic import ValidationError
 
-from config import settings
-from database import create_db_and_tables
+from config import get_settings
+from database import create_db_and_tables, get_engine
+from routers import hadith, masjids, tasks
+
+
+settings = get_settings()
+
+# Static endpoint payloads, built once from settings at import
+ROOT_RESPONSE = {
+    "message": "SalaatFlow API - Prayer & Spiritual Task Management",
+    "version": settings.app_version,
+    "phase": "II - Full-Stack Web Application",
+    "docs": "/docs",
+    "api": settings.api_v1_prefix,
+    "status": "operational",
+}
+
+HEALTH_RESPONSE = {
+    "status": "healthy",
+    "environment": settings.environment,
+    "version": settings.app_version,
+}
 
 
 # ============================================================================
@@ -24,7 +47,7 @@ async def lifespan(app: FastAPI):
 
     Handles startup and shutdown events:
     - Startup: Create database tables
-    - Shutdown: Cleanup resources
+    - Shutdown: Close pooled database connections
     """
     # Startup: Create database tables
     print("🚀 Starting SalaatFlow API...")
@@ -32,7 +55,7 @@ async def lifespan(app: FastAPI):
     print(f"🔗 Database: Connected")
 
     try:
-        create_db_and_tables()
+        await create_db_and_tables()
         print("✅ Database tables created/verified")
     except Exception as e:
         print(f"⚠️  Database initialization warning: {e}")
@@ -41,6 +64,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     print("👋 Shutting down SalaatFlow API...")
+    await get_engine().dispose()
 
 
 # ============================================================================
@@ -52,6 +76,7 @@ app = FastAPI(
     version=settings.app_version,
     description="REST API for Islamic Prayer & Spiritual Task Management",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson encodes straight to UTF-8 bytes, in C
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -68,9 +93,28 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # Allow all HTTP methods
     allow_headers=["*"],  # Allow all headers
+    expose_headers=["X-Total-Count", "X-Next-Cursor"],  # Pagination headers on list endpoints
 )
 
 
+# ============================================================================
+# Exception Handlers
+# ============================================================================
+
+@app.exception_handler(ValidationError)
+async def validation_error_handler(request: Request, exc: ValidationError) -> JSONResponse:
+    """
+    Report request payloads that fail model validation as 422 errors.
+
+    Routers validate table-model bodies explicitly (see models.validate_new),
+    so these errors describe bad client input, not server faults.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"detail": jsonable_encoder(exc.errors(include_url=False, include_context=False))},
+    )
+
+
 # ============================================================================
 # Root Endpoints
 # ============================================================================
@@ -83,14 +127,7 @@ async def root():
     Returns:
         dict: Welcome message and API information
     """
-    return {
-        "message": "SalaatFlow API - Prayer & Spiritual Task Management",
-        "version": settings.app_version,
-        "phase": "II - Full-Stack Web Application",
-        "docs": "/docs",
-        "api": settings.api_v1_prefix,
-        "status": "operational",
-    }
+    return ROOT_RESPONSE
 
 
 @app.get("/health")
@@ -101,36 +138,22 @@ async def health_check():
     Returns:
         dict: API health status
     """
-    return {
-        "status": "healthy",
-        "environment": settings.environment,
-        "version": settings.app_version,
-    }
+    return HEALTH_RESPONSE
 
 
 # ============================================================================
 # API Routers
 # ============================================================================
 
-from routers import tasks, masjids, hadith
-
-app.include_router(
-    tasks.router,
-    prefix=f"{settings.api_v1_prefix}/tasks",
-    tags=["Tasks"]
-)
-
-app.include_router(
-    masjids.router,
-    prefix=f"{settings.api_v1_prefix}/masjids",
-    tags=["Masjids"]
+# (router, path under the API prefix, OpenAPI tag)
+ROUTERS = (
+    (tasks.router, "/tasks", "Tasks"),
+    (masjids.router, "/masjids", "Masjids"),
+    (hadith.router, "/hadith", "Daily Hadith"),
 )
 
-app.include_router(
-    hadith.router,
-    prefix=f"{settings.api_v1_prefix}/hadith",
-    tags=["Daily Hadith"]
-)
+for router, path, tag in ROUTERS:
+    app.include_router(router, prefix=settings.api_v1_prefix + path, tags=[tag])
 
 
 # ============================================================================
@@ -6,11 +6,65 @@ These models serve as both Pydantic schemas and SQLAlchemy ORM models.
 """
 
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Dict, Iterable, Optional, List, Type, TypeVar
 from enum import Enum
+from sqlalchemy import DateTime, Index, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
 from sqlmodel import SQLModel, Field, Relationship
 
 
+TableModelT = TypeVar("TableModelT", bound=SQLModel)
+
+
+# ============================================================================
+# Timestamps
+# ============================================================================
+#
+# created_at/updated_at are filled in by the database (server default, and
+# onupdate for updated_at) rather than sent from Python, so bulk UPDATEs
+# keep updated_at current too. Clients can never set them.
+
+class utcnow(FunctionElement):
+    """Current UTC time as a naive timestamp, computed by the database"""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw) -> str:
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+@compiles(utcnow, "sqlite")
+def _sqlite_utcnow(element, compiler, **kw) -> str:
+    # UTC, in the same text form SQLAlchemy binds datetimes as (microseconds
+    # included), so stored values compare correctly against parameters
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+SERVER_MANAGED_FIELDS = ("created_at", "updated_at")
+
+
+def CreatedAtField() -> Any:
+    """Field for a creation timestamp set by the database on INSERT"""
+    return Field(default=None, nullable=False, sa_column_kwargs={"server_default": utcnow()})
+
+
+def UpdatedAtField() -> Any:
+    """Field for a modification timestamp set by the database on INSERT and UPDATE"""
+    return Field(
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": utcnow(), "onupdate": utcnow()},
+    )
+
+
 # ============================================================================
 # Enums
 # ============================================================================
@@ -63,6 +117,28 @@ class SpiritualTask(SQLModel, table=True):
         updated_at: Last modification timestamp
     """
     __tablename__ = "spiritual_tasks"
+    __table_args__ = (
+        # Default sort of list_tasks, and its (created_at, id) keyset cursor
+        Index("ix_spiritual_tasks_created_at", "created_at", "id"),
+        # A masjid's tasks, newest first (PostgreSQL doesn't index foreign keys)
+        Index("ix_spiritual_tasks_masjid_created", "masjid_id", "created_at"),
+        # Upcoming/overdue only ever look at incomplete tasks with a due date
+        Index(
+            "ix_spiritual_tasks_open_due", "due_datetime",
+            postgresql_where=text("completed = false"),
+            sqlite_where=text("completed = 0"),
+        ),
+        # Trigram indexes let search's ILIKE '%q%' use an index (PostgreSQL pg_trgm)
+        Index(
+            "ix_spiritual_tasks_title_trgm", "title",
+            postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_spiritual_tasks_description_trgm", "description",
+            postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+    __mapper_args__ = {"eager_defaults": True}  # Fetch DB-set timestamps via RETURNING
 
     # Primary key
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -78,7 +154,10 @@ class SpiritualTask(SQLModel, table=True):
 
     # Masjid relationship
     masjid_id: Optional[int] = Field(default=None, foreign_key="masjids.id")
-    masjid: Optional["Masjid"] = Relationship(back_populates="tasks")
+    masjid: Optional["Masjid"] = Relationship(
+        back_populates="tasks",
+        sa_relationship_kwargs={"lazy": "raise"},  # Load explicitly; never one query per row
+    )
 
     # Scheduling
     due_datetime: Optional[datetime] = Field(default=None, index=True)
@@ -88,8 +167,8 @@ class SpiritualTask(SQLModel, table=True):
     completed: bool = Field(default=False, index=True)
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = CreatedAtField()
+    updated_at: Optional[datetime] = UpdatedAtField()
 
 
 # ============================================================================
@@ -112,6 +191,18 @@ class Masjid(SQLModel, table=True):
         updated_at: Last modification timestamp
     """
     __tablename__ = "masjids"
+    __mapper_args__ = {"eager_defaults": True}  # Fetch DB-set timestamps via RETURNING
+    __table_args__ = (
+        # Trigram indexes let search's ILIKE '%q%' use an index (PostgreSQL pg_trgm)
+        Index(
+            "ix_masjids_name_trgm", "name",
+            postgresql_using="gin", postgresql_ops={"name": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_masjids_area_trgm", "area",
+            postgresql_using="gin", postgresql_ops={"area": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
 
     # Primary key
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -127,11 +218,14 @@ class Masjid(SQLModel, table=True):
     phone: Optional[str] = Field(default=None, max_length=20)
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: Optional[datetime] = CreatedAtField()
+    updated_at: Optional[datetime] = UpdatedAtField()
 
     # Relationships
-    tasks: List["SpiritualTask"] = Relationship(back_populates="masjid")
+    tasks: List["SpiritualTask"] = Relationship(
+        back_populates="masjid",
+        sa_relationship_kwargs={"lazy": "raise"},  # Load explicitly; never one query per row
+    )
 
 
 # ============================================================================
@@ -150,8 +244,10 @@ class DailyHadith(SQLModel, table=True):
         reference: Source reference (e.g., "Sahih Bukhari 1234") (max 200 chars)
         narrator: Name of narrator (max 200 chars)
         created_at: Creation timestamp
+        updated_at: Last modification timestamp
     """
     __tablename__ = "daily_hadith"
+    __mapper_args__ = {"eager_defaults": True}  # Fetch DB-set timestamps via RETURNING
 
     # Primary key
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -165,5 +261,110 @@ class DailyHadith(SQLModel, table=True):
     reference: str = Field(max_length=200)  # e.g., "Sahih Bukhari 1234"
     narrator: Optional[str] = Field(default=None, max_length=200)
 
-    # Timestamp
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Timestamps
+    created_at: Optional[datetime] = CreatedAtField()
+    updated_at: Optional[datetime] = UpdatedAtField()
+
+
+# ============================================================================
+# Response Schemas
+# ============================================================================
+#
+# Plain (non-table) models used as endpoint response_models. FastAPI
+# re-validates every returned row against the response_model; doing that
+# with a table model builds a new ORM-instrumented instance per row, which
+# is several times slower than validating these.
+
+class SpiritualTaskRead(SQLModel):
+    """Spiritual task as returned by the API"""
+    id: int
+    title: str
+    description: Optional[str] = None
+    category: TaskCategory
+    priority: Priority
+    tags: Optional[str] = None
+    masjid_id: Optional[int] = None
+    due_datetime: Optional[datetime] = None
+    recurrence: Recurrence
+    completed: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class MasjidRead(SQLModel):
+    """Masjid as returned by the API"""
+    id: int
+    name: str
+    area: str
+    city: Optional[str] = None
+    address: Optional[str] = None
+    imam_name: Optional[str] = None
+    phone: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+class DailyHadithRead(SQLModel):
+    """Daily hadith as returned by the API"""
+    id: int
+    date: datetime
+    arabic_text: str
+    english_translation: str
+    reference: str
+    narrator: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+# ============================================================================
+# Payload Validation
+# ============================================================================
+#
+# Table models (table=True) skip Pydantic validation when FastAPI builds them
+# from a request body, so datetimes and enums arrive as raw strings. asyncpg
+# (unlike psycopg2) will not cast strings to timestamps, so payloads are
+# validated explicitly before they reach the database. A failed validation
+# raises pydantic.ValidationError, which main.py maps to a 422 response.
+
+def validate_new(
+    model: Type[TableModelT],
+    payload: SQLModel,
+    exclude: Iterable[str] = SERVER_MANAGED_FIELDS,
+) -> TableModelT:
+    """
+    Build a validated table model instance from a request payload.
+
+    Args:
+        model: Table model class
+        payload: Unvalidated instance parsed from the request body
+        exclude: Fields the client may never set
+
+    Returns:
+        A new, fully validated instance of ``model``
+    """
+    data = payload.model_dump(exclude_unset=True, exclude=set(exclude), warnings=False)
+    return model.model_validate(data)
+
+
+def validate_updates(
+    current: TableModelT,
+    payload: SQLModel,
+    exclude: Iterable[str] = ("id", *SERVER_MANAGED_FIELDS),
+) -> Dict[str, Any]:
+    """
+    Validate the fields a request sets against an existing row.
+
+    The updates are merged onto the current values and validated as a whole,
+    so partial updates stay possible while the result is always a valid row.
+
+    Args:
+        current: Existing row being updated
+        payload: Unvalidated instance parsed from the request body
+        exclude: Fields that may never be updated
+
+    Returns:
+        Dict of validated values for the fields the request set
+    """
+    updates = payload.model_dump(exclude_unset=True, exclude=set(exclude), warnings=False)
+    merged = type(current).model_validate({**current.model_dump(), **updates})
+    return {key: getattr(merged, key) for key in updates}
@@ -5,13 +5,18 @@ REST API endpoints for daily hadith management.
 Provides endpoints to create, retrieve, and manage hadith of the day.
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlmodel import Session, select, col
-from datetime import datetime, date
+import asyncio
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import func
+from sqlmodel import select, col, delete
+from sqlmodel.ext.asyncio.session import AsyncSession
+from datetime import datetime, date, time, timedelta
+from time import monotonic
 
-from database import get_session
-from models import DailyHadith
+from database import get_db_session, get_session, scalar_on_own_session
+from models import DailyHadith, DailyHadithRead, validate_new, validate_updates
 
 
 # ============================================================================
@@ -20,21 +25,149 @@ from models import DailyHadith
 
 router = APIRouter()
 
+# Daily hadith lookups, cached per process as day -> (expires_at, hadith, etag).
+# Writes clear the cache; the TTL bounds staleness across worker processes.
+_DAILY_CACHE_TTL = 300  # seconds
+_DAILY_CACHE_MAX = 64
+_daily_cache: Dict[date, Tuple[float, DailyHadith, str]] = {}
+
+# Bumped by every hadith write; a lookup that started before a write must
+# not cache what it read
+_daily_generation = 0
+
+# Daily lookups in progress, so concurrent cache misses for a day share one query
+_daily_inflight: Dict[date, "asyncio.Task[Optional[Tuple[DailyHadith, str]]]"] = {}
+
+
+def _same_day(day: date):
+    """
+    Build a predicate matching hadith dated on the given calendar day.
+
+    Compares against a half-open [midnight, next midnight) range rather than
+    casting the column, so the index on DailyHadith.date is used.
+
+    Args:
+        day: Calendar day to match
+
+    Returns:
+        SQL expression for the WHERE clause
+    """
+    start = datetime.combine(day, time.min)
+    return (col(DailyHadith.date) >= start) & (col(DailyHadith.date) < start + timedelta(days=1))
+
+
+def _etag(hadith_id: int, updated_at: datetime) -> str:
+    """
+    Build a strong ETag for a hadith.
+
+    The database bumps updated_at on every write, so id plus updated_at
+    identifies a version without reading or hashing the content.
+
+    Args:
+        hadith_id: Hadith ID
+        updated_at: Hadith's last modification timestamp
+
+    Returns:
+        Quoted ETag value
+    """
+    return f'"{hadith_id}-{updated_at:%Y%m%d%H%M%S%f}"'
+
+
+def _not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    Build a 304 response if the client already holds this version.
+
+    Args:
+        request: Incoming request (checked for If-None-Match)
+        etag: Current ETag of the resource
+
+    Returns:
+        Response: 304 Not Modified, or None if the client's copy is stale
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return None
+
+
+def _invalidate_daily() -> None:
+    """
+    Drop cached and in-flight daily lookups (call after every hadith write).
+
+    In-flight lookups are detached rather than cancelled: requests already
+    waiting on them still get their answer, but later requests start a new
+    lookup instead of joining one that began before the write.
+    """
+    global _daily_generation
+    _daily_generation += 1
+    _daily_cache.clear()
+    _daily_inflight.clear()
+
+
+def _finish_lookup(target_date: date, lookup: asyncio.Task) -> None:
+    """Forget a finished lookup, unless a newer one has replaced it."""
+    if _daily_inflight.get(target_date) is lookup:
+        del _daily_inflight[target_date]
+
+
+async def _load_daily(target_date: date) -> Optional[Tuple[DailyHadith, str]]:
+    """
+    Look up a day's hadith and cache it.
+
+    Runs on its own session, as a task shared by every request that missed
+    the cache for this day, so it must not depend on any one request.
+
+    Args:
+        target_date: Calendar day to look up
+
+    Returns:
+        Tuple of (detached hadith, ETag), or None if the day has no hadith
+    """
+    generation = _daily_generation
+
+    # Query for hadith on this date (match by date only, not time)
+    async with get_db_session() as session:
+        hadith = (await session.exec(
+            select(DailyHadith).where(_same_day(target_date))
+        )).first()
+
+    if not hadith:
+        return None
+
+    # Cache a detached copy so no session state is shared between requests
+    hadith = DailyHadith.model_validate(hadith)
+    etag = _etag(hadith.id, hadith.updated_at)
+    if generation != _daily_generation:
+        # A write landed during the query; what we read may already be stale
+        return hadith, etag
+    if len(_daily_cache) >= _DAILY_CACHE_MAX:
+        _daily_cache.clear()
+    _daily_cache[target_date] = (monotonic() + _DAILY_CACHE_TTL, hadith, etag)
+    return hadith, etag
+
 
 # ============================================================================
 # Daily Hadith Endpoints
 # ============================================================================
 
-@router.get("/daily", response_model=DailyHadith)
+@router.get("/daily", response_model=DailyHadithRead)
 async def get_daily_hadith(
-    session: Session = Depends(get_session),
+    request: Request,
+    response: Response,
     date_param: Optional[str] = Query(None, description="Date in YYYY-MM-DD format (defaults to today)")
 ) -> DailyHadith:
     """
     Get the hadith for a specific date (defaults to today).
 
+    Responses carry an ETag; a matching If-None-Match gets 304 Not Modified.
+    Concurrent requests for an uncached day wait on a single lookup.
+
     Args:
-        session: Database session
+        request: Incoming request
+        response: Outgoing response (for the ETag header)
         date_param: Optional date string in YYYY-MM-DD format
 
     Returns:
@@ -46,7 +179,7 @@ async def get_daily_hadith(
     # Parse date or use today
     if date_param:
         try:
-            target_date = datetime.strptime(date_param, "%Y-%m-%d").date()
+            target_date = date.fromisoformat(date_param)
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -55,26 +188,37 @@ async def get_daily_hadith(
     else:
         target_date = date.today()
 
-    # Query for hadith on this date (match by date only, not time)
-    hadith = session.exec(
-        select(DailyHadith).where(
-            col(DailyHadith.date).cast(date) == target_date
-        )
-    ).first()
+    cached = _daily_cache.get(target_date)
+    if cached and cached[0] > monotonic():
+        _, hadith, etag = cached
+    else:
+        lookup = _daily_inflight.get(target_date)
+        if lookup is None:
+            lookup = asyncio.ensure_future(_load_daily(target_date))
+            _daily_inflight[target_date] = lookup
+            lookup.add_done_callback(partial(_finish_lookup, target_date))
+
+        # Shielded so one client disconnecting doesn't cancel the others' lookup
+        loaded = await asyncio.shield(lookup)
+        if loaded is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No hadith found for date {target_date}"
+            )
+        hadith, etag = loaded
 
-    if not hadith:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No hadith found for date {target_date}"
-        )
+    not_modified = _not_modified(request, etag)
+    if not_modified:
+        return not_modified
 
+    response.headers["ETag"] = etag
     return hadith
 
 
-@router.post("/", response_model=DailyHadith, status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=DailyHadithRead, status_code=status.HTTP_201_CREATED)
 async def create_hadith(
     hadith: DailyHadith,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> DailyHadith:
     """
     Create a new daily hadith entry.
@@ -89,14 +233,14 @@ async def create_hadith(
     Raises:
         HTTPException: 400 if hadith already exists for this date
     """
+    hadith = validate_new(DailyHadith, hadith)
+
     # Check for duplicate date
     hadith_date = hadith.date.date() if isinstance(hadith.date, datetime) else hadith.date
 
-    existing = session.exec(
-        select(DailyHadith).where(
-            col(DailyHadith.date).cast(date) == hadith_date
-        )
-    ).first()
+    existing = (await session.exec(
+        select(DailyHadith).where(_same_day(hadith_date))
+    )).first()
 
     if existing:
         raise HTTPException(
@@ -104,27 +248,32 @@ async def create_hadith(
             detail=f"Hadith already exists for date {hadith_date}"
         )
 
-    # Set timestamp
-    hadith.created_at = datetime.utcnow()
-
     # Add to database
     session.add(hadith)
-    session.commit()
-    session.refresh(hadith)
+    await session.commit()
+    _invalidate_daily()
+    await session.refresh(hadith)
 
     return hadith
 
 
-@router.get("/{hadith_id}", response_model=DailyHadith)
+@router.get("/{hadith_id}", response_model=DailyHadithRead)
 async def get_hadith(
     hadith_id: int,
-    session: Session = Depends(get_session)
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_session)
 ) -> DailyHadith:
     """
     Get a specific hadith by ID.
 
+    Responses carry an ETag; a matching If-None-Match gets 304 Not Modified,
+    checked against the row's updated_at alone before the row is loaded.
+
     Args:
         hadith_id: Hadith ID
+        request: Incoming request
+        response: Outgoing response (for the ETag header)
         session: Database session
 
     Returns:
@@ -133,18 +282,30 @@ async def get_hadith(
     Raises:
         HTTPException: 404 if hadith not found
     """
-    hadith = session.get(DailyHadith, hadith_id)
+    if "if-none-match" in request.headers:
+        updated_at = await session.scalar(
+            select(DailyHadith.updated_at).where(DailyHadith.id == hadith_id)
+        )
+        if updated_at is not None:
+            not_modified = _not_modified(request, _etag(hadith_id, updated_at))
+            if not_modified:
+                return not_modified
+
+    hadith = await session.get(DailyHadith, hadith_id)
     if not hadith:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Hadith with ID {hadith_id} not found"
         )
+
+    response.headers["ETag"] = _etag(hadith.id, hadith.updated_at)
     return hadith
 
 
-@router.get("/", response_model=List[DailyHadith])
+@router.get("/", response_model=List[DailyHadithRead])
 async def list_hadith(
-    session: Session = Depends(get_session),
+    response: Response,
+    session: AsyncSession = Depends(get_session),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
     sort_order: str = Query("desc", description="Sort by date: asc or desc"),
@@ -158,12 +319,14 @@ async def list_hadith(
         - sort_order: Sort by date - asc or desc (default: desc)
 
     Returns:
-        List[DailyHadith]: List of hadith entries
+        List[DailyHadith]: List of hadith entries (total count in the
+        X-Total-Count header)
     """
     # Build query
     query = select(DailyHadith)
 
-    # Apply sorting by date
+    # Apply sorting by date (the unique index on date is walked in either
+    # direction, so neither order needs a sort step)
     if sort_order.lower() == "asc":
         query = query.order_by(col(DailyHadith.date).asc())
     else:
@@ -172,16 +335,20 @@ async def list_hadith(
     # Apply pagination
     query = query.offset(skip).limit(limit)
 
-    # Execute query
-    hadith_list = session.exec(query).all()
-    return hadith_list
+    # Count and fetch the page concurrently, on separate connections
+    total, result = await asyncio.gather(
+        scalar_on_own_session(select(func.count()).select_from(DailyHadith)),
+        session.exec(query),
+    )
+    response.headers["X-Total-Count"] = str(total)
+    return result.all()
 
 
-@router.put("/{hadith_id}", response_model=DailyHadith)
+@router.put("/{hadith_id}", response_model=DailyHadithRead)
 async def update_hadith(
     hadith_id: int,
     hadith_update: DailyHadith,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> DailyHadith:
     """
     Update an existing hadith entry.
@@ -198,39 +365,40 @@ async def update_hadith(
         HTTPException: 404 if hadith not found, 400 if date conflict
     """
     # Get existing hadith
-    hadith = session.get(DailyHadith, hadith_id)
+    hadith = await session.get(DailyHadith, hadith_id)
     if not hadith:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Hadith with ID {hadith_id} not found"
         )
 
+    # Validate the fields being changed (excluding ID and created_at)
+    hadith_data = validate_updates(hadith, hadith_update)
+
     # Check for date conflict (if date is being changed)
-    if hadith_update.date:
-        new_date = hadith_update.date.date() if isinstance(hadith_update.date, datetime) else hadith_update.date
+    if hadith_data.get("date"):
+        new_date = hadith_data["date"].date() if isinstance(hadith_data["date"], datetime) else hadith_data["date"]
         current_date = hadith.date.date() if isinstance(hadith.date, datetime) else hadith.date
 
         if new_date != current_date:
-            existing = session.exec(
-                select(DailyHadith).where(
-                    col(DailyHadith.date).cast(date) == new_date
-                )
-            ).first()
+            existing = (await session.exec(
+                select(DailyHadith).where(_same_day(new_date))
+            )).first()
             if existing:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Hadith already exists for date {new_date}"
                 )
 
-    # Update fields (excluding ID and created_at)
-    hadith_data = hadith_update.model_dump(exclude_unset=True, exclude={"id", "created_at"})
+    # Update fields
     for key, value in hadith_data.items():
         setattr(hadith, key, value)
 
     # Save to database
     session.add(hadith)
-    session.commit()
-    session.refresh(hadith)
+    await session.commit()
+    _invalidate_daily()
+    await session.refresh(hadith)
 
     return hadith
 
@@ -238,7 +406,7 @@ async def update_hadith(
 @router.delete("/{hadith_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_hadith(
     hadith_id: int,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> None:
     """
     Delete a hadith entry.
@@ -250,12 +418,15 @@ async def delete_hadith(
     Raises:
         HTTPException: 404 if hadith not found
     """
-    hadith = session.get(DailyHadith, hadith_id)
-    if not hadith:
+    # Delete directly; RETURNING tells us whether the row existed
+    deleted_id = await session.scalar(
+        delete(DailyHadith).where(DailyHadith.id == hadith_id).returning(DailyHadith.id)
+    )
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Hadith with ID {hadith_id} not found"
         )
 
-    session.delete(hadith)
-    session.commit()
+    await session.commit()
+    _invalidate_daily()
@@ -5,13 +5,18 @@ REST API endpoints for masjid (mosque) management.
 Provides CRUD operations and task association queries.
 """
 
+import asyncio
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlmodel import Session, select, col
-from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select, col, delete, or_, update
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from database import get_session
-from models import Masjid, SpiritualTask
+from cache import task_cache
+from database import get_session, scalar_on_own_session
+from models import Masjid, MasjidRead, SpiritualTask, SpiritualTaskRead, validate_new, validate_updates
 
 
 # ============================================================================
@@ -20,15 +25,24 @@ from models import Masjid, SpiritualTask
 
 router = APIRouter()
 
+# Columns list_masjids may sort by; anything else falls back to name
+SORTABLE_FIELDS = {
+    "name": Masjid.name,
+    "area": Masjid.area,
+    "city": Masjid.city,
+    "created_at": Masjid.created_at,
+    "updated_at": Masjid.updated_at,
+}
+
 
 # ============================================================================
 # CRUD Endpoints
 # ============================================================================
 
-@router.post("/", response_model=Masjid, status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=MasjidRead, status_code=status.HTTP_201_CREATED)
 async def create_masjid(
     masjid: Masjid,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> Masjid:
     """
     Create a new masjid.
@@ -43,32 +57,31 @@ async def create_masjid(
     Raises:
         HTTPException: 400 if masjid name already exists
     """
-    # Check for duplicate name
-    existing = session.exec(
-        select(Masjid).where(Masjid.name == masjid.name)
-    ).first()
+    masjid = validate_new(Masjid, masjid)
+
+    # Insert unless the name is taken; the unique index decides, in one round-trip
+    created = await session.scalar(
+        insert(Masjid)
+        .values(**masjid.model_dump(exclude_unset=True, exclude={"id"}))
+        .on_conflict_do_nothing(index_elements=["name"])
+        .returning(Masjid)
+    )
 
-    if existing:
+    if created is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Masjid with name '{masjid.name}' already exists"
         )
 
-    # Set timestamps
-    masjid.created_at = datetime.utcnow()
-    masjid.updated_at = datetime.utcnow()
+    await session.commit()
 
-    # Add to database
-    session.add(masjid)
-    session.commit()
-    session.refresh(masjid)
-
-    return masjid
+    return created
 
 
-@router.get("/", response_model=List[Masjid])
+@router.get("/", response_model=List[MasjidRead])
 async def list_masjids(
-    session: Session = Depends(get_session),
+    response: Response,
+    session: AsyncSession = Depends(get_session),
     # Filtering parameters
     area: Optional[str] = Query(None, description="Filter by area"),
     city: Optional[str] = Query(None, description="Filter by city"),
@@ -91,19 +104,21 @@ async def list_masjids(
         - limit: Maximum records to return (default: 100, max: 1000)
 
     Returns:
-        List[Masjid]: List of masjids matching criteria
+        List[Masjid]: List of masjids matching criteria (total count in the
+        X-Total-Count header)
     """
-    # Build query
-    query = select(Masjid)
-
-    # Apply filters
+    # Build filters
+    filters = []
     if area:
-        query = query.where(Masjid.area == area)
+        filters.append(Masjid.area == area)
     if city:
-        query = query.where(Masjid.city == city)
+        filters.append(Masjid.city == city)
+
+    query = select(Masjid).where(*filters)
+    count_query = select(func.count()).select_from(Masjid).where(*filters)
 
     # Apply sorting
-    sort_field = getattr(Masjid, sort_by, Masjid.name)
+    sort_field = SORTABLE_FIELDS.get(sort_by, Masjid.name)
     if sort_order.lower() == "desc":
         query = query.order_by(col(sort_field).desc())
     else:
@@ -112,15 +127,19 @@ async def list_masjids(
     # Apply pagination
     query = query.offset(skip).limit(limit)
 
-    # Execute query
-    masjids = session.exec(query).all()
-    return masjids
+    # Count and fetch the page concurrently, on separate connections
+    total, result = await asyncio.gather(
+        scalar_on_own_session(count_query),
+        session.exec(query),
+    )
+    response.headers["X-Total-Count"] = str(total)
+    return result.all()
 
 
-@router.get("/{masjid_id}", response_model=Masjid)
+@router.get("/{masjid_id}", response_model=MasjidRead)
 async def get_masjid(
     masjid_id: int,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> Masjid:
     """
     Get a specific masjid by ID.
@@ -135,7 +154,7 @@ async def get_masjid(
     Raises:
         HTTPException: 404 if masjid not found
     """
-    masjid = session.get(Masjid, masjid_id)
+    masjid = await session.get(Masjid, masjid_id)
     if not masjid:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -144,11 +163,11 @@ async def get_masjid(
     return masjid
 
 
-@router.put("/{masjid_id}", response_model=Masjid)
+@router.put("/{masjid_id}", response_model=MasjidRead)
 async def update_masjid(
     masjid_id: int,
     masjid_update: Masjid,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> Masjid:
     """
     Update an existing masjid.
@@ -165,36 +184,34 @@ async def update_masjid(
         HTTPException: 404 if masjid not found, 400 if name conflict
     """
     # Get existing masjid
-    masjid = session.get(Masjid, masjid_id)
+    masjid = await session.get(Masjid, masjid_id)
     if not masjid:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Masjid with ID {masjid_id} not found"
         )
 
-    # Check for name conflict (if name is being changed)
-    if masjid_update.name and masjid_update.name != masjid.name:
-        existing = session.exec(
-            select(Masjid).where(Masjid.name == masjid_update.name)
-        ).first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Masjid with name '{masjid_update.name}' already exists"
-            )
-
-    # Update fields (excluding ID and created_at)
-    masjid_data = masjid_update.model_dump(exclude_unset=True, exclude={"id", "created_at"})
+    # Validate the fields being changed (excluding ID and created_at)
+    masjid_data = validate_updates(masjid, masjid_update)
+
+    # Update fields
     for key, value in masjid_data.items():
         setattr(masjid, key, value)
 
-    # Update timestamp
-    masjid.updated_at = datetime.utcnow()
-
-    # Save to database
+    # Save to database; a name conflict is reported by the unique index
     session.add(masjid)
-    session.commit()
-    session.refresh(masjid)
+    try:
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        if "name" not in masjid_data:
+            # Not a name conflict (only the name is unique); let it surface as a 500
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Masjid with name '{masjid_data['name']}' already exists"
+        )
+    await session.refresh(masjid)
 
     return masjid
 
@@ -202,7 +219,7 @@ async def update_masjid(
 @router.delete("/{masjid_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_masjid(
     masjid_id: int,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> None:
     """
     Delete a masjid.
@@ -216,36 +233,37 @@ async def delete_masjid(
     Raises:
         HTTPException: 404 if masjid not found
     """
-    masjid = session.get(Masjid, masjid_id)
-    if not masjid:
+    # Nullify masjid_id in associated tasks with one statement, however many there are
+    await session.exec(
+        update(SpiritualTask)
+        .where(SpiritualTask.masjid_id == masjid_id)
+        .values(masjid_id=None)  # updated_at is bumped by the database
+    )
+
+    # Delete masjid (same transaction as the update above); RETURNING tells
+    # us whether it existed
+    deleted_id = await session.scalar(
+        delete(Masjid).where(Masjid.id == masjid_id).returning(Masjid.id)
+    )
+    if deleted_id is None:
+        await session.rollback()
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Masjid with ID {masjid_id} not found"
         )
 
-    # Nullify masjid_id in associated tasks
-    tasks = session.exec(
-        select(SpiritualTask).where(SpiritualTask.masjid_id == masjid_id)
-    ).all()
-
-    for task in tasks:
-        task.masjid_id = None
-        task.updated_at = datetime.utcnow()
-        session.add(task)
-
-    # Delete masjid
-    session.delete(masjid)
-    session.commit()
+    await session.commit()
+    task_cache.clear()  # Tasks lost their masjid_id
 
 
 # ============================================================================
 # Task Association Endpoints
 # ============================================================================
 
-@router.get("/{masjid_id}/tasks", response_model=List[SpiritualTask])
+@router.get("/{masjid_id}/tasks", response_model=List[SpiritualTaskRead])
 async def get_masjid_tasks(
     masjid_id: int,
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     completed: Optional[bool] = Query(None, description="Filter by completion status"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
@@ -267,7 +285,7 @@ async def get_masjid_tasks(
         HTTPException: 404 if masjid not found
     """
     # Verify masjid exists
-    masjid = session.get(Masjid, masjid_id)
+    masjid = await session.get(Masjid, masjid_id)
     if not masjid:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -285,7 +303,7 @@ async def get_masjid_tasks(
     query = query.order_by(col(SpiritualTask.created_at).desc()).offset(skip).limit(limit)
 
     # Execute query
-    tasks = session.exec(query).all()
+    tasks = (await session.exec(query)).all()
     return tasks
 
 
@@ -293,10 +311,10 @@ async def get_masjid_tasks(
 # Search Endpoint
 # ============================================================================
 
-@router.get("/search/query", response_model=List[Masjid])
+@router.get("/search/query", response_model=List[MasjidRead])
 async def search_masjids(
     q: str = Query(..., min_length=1, description="Search query string"),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=500),
 ) -> List[Masjid]:
@@ -312,9 +330,7 @@ async def search_masjids(
     Returns:
         List[Masjid]: Matching masjids
     """
-    # Build search query (case-insensitive partial match)
-    from sqlmodel import or_
-
+    # Build search query (case-insensitive partial match, trigram-indexed)
     search_pattern = f"%{q}%"
     query = select(Masjid).where(
         or_(
@@ -323,5 +339,5 @@ async def search_masjids(
         )
     ).offset(skip).limit(limit)
 
-    masjids = session.exec(query).all()
+    masjids = (await session.exec(query)).all()
     return masjids
@@ -5,13 +5,16 @@ REST API endpoints for spiritual task management.
 Provides CRUD operations, filtering, sorting, and search functionality.
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlmodel import Session, select, or_, and_, col
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from sqlalchemy import bindparam, case, func, tuple_
+from sqlmodel import select, or_, and_, col, delete, update
+from sqlmodel.ext.asyncio.session import AsyncSession
 from datetime import datetime
 
-from database import get_session
-from models import SpiritualTask, TaskCategory, Priority, Recurrence
+from cache import invalidate_tasks, task_cache, task_stats
+from database import get_db_session, get_session
+from models import SpiritualTask, SpiritualTaskRead, TaskCategory, Priority, Recurrence, validate_new, validate_updates
 
 
 # ============================================================================
@@ -20,15 +23,121 @@ from models import SpiritualTask, TaskCategory, Priority, Recurrence
 
 router = APIRouter()
 
+# Plain column selects for read-only listings: rows come back as tuples and
+# are validated straight into SpiritualTaskRead, with no ORM instances built
+TASK_COLUMNS = tuple(SpiritualTask.__table__.columns)
+
+
+# ============================================================================
+# Minimal Responses
+# ============================================================================
+
+def _minimal_response(prefer: Optional[str]) -> Optional[Response]:
+    """
+    Build an empty 204 response if the client sent Prefer: return=minimal.
+
+    Lets clients that already know the outcome of a write (e.g. a completion
+    toggle) skip receiving and parsing the updated row.
+
+    Args:
+        prefer: Value of the Prefer request header, if any
+
+    Returns:
+        Response: 204 No Content, or None if the full row should be returned
+    """
+    if prefer and "return=minimal" in (token.strip().lower() for token in prefer.split(",")):
+        return Response(
+            status_code=status.HTTP_204_NO_CONTENT,
+            headers={"Preference-Applied": "return=minimal"},
+        )
+    return None
+
+
+# ============================================================================
+# Keyset Pagination
+# ============================================================================
+
+# Response header carrying the cursor for the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_cursor(task: SpiritualTaskRead) -> str:
+    """
+    Build the opaque cursor pointing just past a task.
+
+    Args:
+        task: Last task of the current page
+
+    Returns:
+        Cursor string of the form "<created_at ISO>_<id>"
+    """
+    return f"{task.created_at.isoformat()}_{task.id}"
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Parse a cursor produced by _encode_cursor.
+
+    Args:
+        cursor: Cursor from a previous X-Next-Cursor header
+
+    Returns:
+        Tuple of (created_at, id) of the last task already seen
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed
+    """
+    try:
+        created_at, task_id = cursor.rsplit("_", 1)
+        return datetime.fromisoformat(created_at), int(task_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def _seek(query, cursor: str, descending: bool = True):
+    """
+    Restrict a (created_at, id)-ordered query to rows after a cursor.
+
+    Unlike OFFSET, the database seeks straight to the cursor position, so
+    deep pages cost the same as the first one.
+
+    Args:
+        query: Select ordered by created_at then id
+        cursor: Cursor from a previous X-Next-Cursor header
+        descending: Whether the query is ordered newest first
+
+    Returns:
+        The query with the keyset predicate applied
+    """
+    position = tuple_(SpiritualTask.created_at, SpiritualTask.id)
+    after = tuple_(*_decode_cursor(cursor))
+    return query.where(position < after if descending else position > after)
+
+
+def _set_next_cursor(response: Response, tasks: List[SpiritualTaskRead], limit: int) -> None:
+    """
+    Advertise the next page's cursor when the current page is full.
+
+    Args:
+        response: Outgoing response
+        tasks: Tasks on the current page
+        limit: Requested page size
+    """
+    if len(tasks) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(tasks[-1])
+
 
 # ============================================================================
 # CRUD Endpoints
 # ============================================================================
 
-@router.post("/", response_model=SpiritualTask, status_code=status.HTTP_201_CREATED)
+@router.post("/", response_model=SpiritualTaskRead, status_code=status.HTTP_201_CREATED)
 async def create_task(
     task: SpiritualTask,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> SpiritualTask:
     """
     Create a new spiritual task.
@@ -43,21 +152,21 @@ async def create_task(
     Raises:
         HTTPException: 400 if validation fails
     """
-    # Set timestamps
-    task.created_at = datetime.utcnow()
-    task.updated_at = datetime.utcnow()
+    task = validate_new(SpiritualTask, task)
 
-    # Add to database
+    # Add to database (the ID and server-default timestamps come back with
+    # the INSERT, so no refresh is needed)
     session.add(task)
-    session.commit()
-    session.refresh(task)
+    await session.commit()
+    invalidate_tasks()
 
     return task
 
 
-@router.get("/", response_model=List[SpiritualTask])
+@router.get("/", response_model=List[SpiritualTaskRead])
 async def list_tasks(
-    session: Session = Depends(get_session),
+    response: Response,
+    session: AsyncSession = Depends(get_session),
     # Filtering parameters
     category: Optional[TaskCategory] = Query(None, description="Filter by category"),
     priority: Optional[Priority] = Query(None, description="Filter by priority"),
@@ -70,6 +179,7 @@ async def list_tasks(
     # Pagination
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page (created_at sort only)"),
 ) -> List[SpiritualTask]:
     """
     List all spiritual tasks with optional filtering, sorting, and pagination.
@@ -84,12 +194,35 @@ async def list_tasks(
         - sort_order: Sort order - asc or desc (default: desc)
         - skip: Number of records to skip (pagination)
         - limit: Maximum records to return (default: 100, max: 1000)
+        - cursor: Resume after the last task of the previous page; prefer
+          this over skip for deep pages (requires sort_by=created_at)
 
     Returns:
-        List[SpiritualTask]: List of tasks matching criteria
+        List[SpiritualTask]: List of tasks matching criteria (cursor for the
+        next page in the X-Next-Cursor header when the page is full)
+
+    Raises:
+        HTTPException: 400 if the cursor is invalid or sort_by isn't created_at
     """
+    descending = sort_order.lower() == "desc"
+    keyset = sort_by == "created_at"
+    if cursor is not None and not keyset:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor pagination requires sort_by=created_at"
+        )
+
+    cache_key = ("list", category, priority, completed, masjid_id, recurrence,
+                 sort_by, descending, skip, limit, cursor)
+    tasks = task_cache.get(cache_key)
+    if tasks is not None:
+        if keyset:
+            _set_next_cursor(response, tasks, limit)
+        return tasks
+    generation = task_cache.generation  # Captured before reading, so a racing write wins
+
     # Build query
-    query = select(SpiritualTask)
+    query = select(*TASK_COLUMNS)
 
     # Apply filters
     filters = []
@@ -106,26 +239,31 @@ async def list_tasks(
 
     if filters:
         query = query.where(and_(*filters))
+    if cursor is not None:
+        query = _seek(query, cursor, descending)
 
-    # Apply sorting
+    # Apply sorting (id breaks ties so pages never overlap)
     sort_field = getattr(SpiritualTask, sort_by, SpiritualTask.created_at)
-    if sort_order.lower() == "desc":
-        query = query.order_by(col(sort_field).desc())
+    if descending:
+        query = query.order_by(col(sort_field).desc(), col(SpiritualTask.id).desc())
     else:
-        query = query.order_by(col(sort_field).asc())
+        query = query.order_by(col(sort_field).asc(), col(SpiritualTask.id).asc())
 
     # Apply pagination
     query = query.offset(skip).limit(limit)
 
     # Execute query
-    tasks = session.exec(query).all()
+    tasks = [SpiritualTaskRead.model_validate(row) for row in (await session.exec(query)).mappings()]
+    task_cache.set(cache_key, tasks, generation=generation)
+    if keyset:
+        _set_next_cursor(response, tasks, limit)
     return tasks
 
 
-@router.get("/{task_id}", response_model=SpiritualTask)
+@router.get("/{task_id}", response_model=SpiritualTaskRead)
 async def get_task(
     task_id: int,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> SpiritualTask:
     """
     Get a specific spiritual task by ID.
@@ -140,7 +278,7 @@ async def get_task(
     Raises:
         HTTPException: 404 if task not found
     """
-    task = session.get(SpiritualTask, task_id)
+    task = await session.get(SpiritualTask, task_id)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -149,11 +287,12 @@ async def get_task(
     return task
 
 
-@router.put("/{task_id}", response_model=SpiritualTask)
+@router.put("/{task_id}", response_model=SpiritualTaskRead)
 async def update_task(
     task_id: int,
     task_update: SpiritualTask,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session),
+    prefer: Optional[str] = Header(None, description="'return=minimal' for an empty 204 response"),
 ) -> SpiritualTask:
     """
     Update an existing spiritual task.
@@ -162,15 +301,16 @@ async def update_task(
         task_id: Task ID to update
         task_update: Updated task data
         session: Database session
+        prefer: Prefer header; return=minimal skips the response body
 
     Returns:
-        SpiritualTask: Updated task
+        SpiritualTask: Updated task (or 204 with Prefer: return=minimal)
 
     Raises:
         HTTPException: 404 if task not found
     """
     # Get existing task
-    task = session.get(SpiritualTask, task_id)
+    task = await session.get(SpiritualTask, task_id)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -178,25 +318,23 @@ async def update_task(
         )
 
     # Update fields (excluding ID and created_at)
-    task_data = task_update.model_dump(exclude_unset=True, exclude={"id", "created_at"})
+    task_data = validate_updates(task, task_update)
     for key, value in task_data.items():
         setattr(task, key, value)
 
-    # Update timestamp
-    task.updated_at = datetime.utcnow()
-
-    # Save to database
+    # Save to database (updated_at is set by the column's onupdate default and
+    # fetched back with the UPDATE, so no refresh is needed)
     session.add(task)
-    session.commit()
-    session.refresh(task)
+    await session.commit()
+    invalidate_tasks()
 
-    return task
+    return _minimal_response(prefer) or task
 
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task(
     task_id: int,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> None:
     """
     Delete a spiritual task.
@@ -208,32 +346,43 @@ async def delete_task(
     Raises:
         HTTPException: 404 if task not found
     """
-    task = session.get(SpiritualTask, task_id)
-    if not task:
+    # Delete directly; RETURNING tells us whether the row existed
+    deleted_id = await session.scalar(
+        delete(SpiritualTask).where(SpiritualTask.id == task_id).returning(SpiritualTask.id)
+    )
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with ID {task_id} not found"
         )
 
-    session.delete(task)
-    session.commit()
+    await session.commit()
+    invalidate_tasks()
 
 
 # ============================================================================
 # Task Completion Endpoints
 # ============================================================================
 
-@router.patch("/{task_id}/complete", response_model=SpiritualTask)
-async def mark_task_complete(
-    task_id: int,
-    session: Session = Depends(get_session)
-) -> SpiritualTask:
+# Built once at import; the hottest write only binds new parameters per call
+_SET_COMPLETED = (
+    update(SpiritualTask)
+    .where(SpiritualTask.id == bindparam("task_id"))
+    .values(completed=bindparam("completed"))
+    .returning(SpiritualTask)
+)
+
+
+async def _set_completed(session: AsyncSession, task_id: int, completed: bool) -> SpiritualTask:
     """
-    Mark a task as completed.
+    Set a task's completion state in one UPDATE ... RETURNING round-trip.
+
+    updated_at is set by the column's onupdate default.
 
     Args:
-        task_id: Task ID
         session: Database session
+        task_id: Task ID
+        completed: New completion state
 
     Returns:
         SpiritualTask: Updated task
@@ -241,56 +390,66 @@ async def mark_task_complete(
     Raises:
         HTTPException: 404 if task not found
     """
-    task = session.get(SpiritualTask, task_id)
-    if not task:
+    task = await session.scalar(
+        _SET_COMPLETED, {"task_id": task_id, "completed": completed}
+    )
+    if task is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Task with ID {task_id} not found"
         )
 
-    task.completed = True
-    task.updated_at = datetime.utcnow()
-
-    session.add(task)
-    session.commit()
-    session.refresh(task)
-
+    await session.commit()
+    invalidate_tasks()
     return task
 
 
-@router.patch("/{task_id}/uncomplete", response_model=SpiritualTask)
-async def mark_task_incomplete(
+@router.patch("/{task_id}/complete", response_model=SpiritualTaskRead)
+async def mark_task_complete(
     task_id: int,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session),
+    prefer: Optional[str] = Header(None, description="'return=minimal' for an empty 204 response"),
 ) -> SpiritualTask:
     """
-    Mark a task as incomplete (undo completion).
+    Mark a task as completed.
 
     Args:
         task_id: Task ID
         session: Database session
+        prefer: Prefer header; return=minimal skips the response body
 
     Returns:
-        SpiritualTask: Updated task
+        SpiritualTask: Updated task (or 204 with Prefer: return=minimal)
 
     Raises:
         HTTPException: 404 if task not found
     """
-    task = session.get(SpiritualTask, task_id)
-    if not task:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with ID {task_id} not found"
-        )
+    task = await _set_completed(session, task_id, True)
+    return _minimal_response(prefer) or task
 
-    task.completed = False
-    task.updated_at = datetime.utcnow()
 
-    session.add(task)
-    session.commit()
-    session.refresh(task)
+@router.patch("/{task_id}/uncomplete", response_model=SpiritualTaskRead)
+async def mark_task_incomplete(
+    task_id: int,
+    session: AsyncSession = Depends(get_session),
+    prefer: Optional[str] = Header(None, description="'return=minimal' for an empty 204 response"),
+) -> SpiritualTask:
+    """
+    Mark a task as incomplete (undo completion).
 
-    return task
+    Args:
+        task_id: Task ID
+        session: Database session
+        prefer: Prefer header; return=minimal skips the response body
+
+    Returns:
+        SpiritualTask: Updated task (or 204 with Prefer: return=minimal)
+
+    Raises:
+        HTTPException: 404 if task not found
+    """
+    task = await _set_completed(session, task_id, False)
+    return _minimal_response(prefer) or task
 
 
 # ============================================================================
@@ -300,7 +459,7 @@ async def mark_task_incomplete(
 @router.post("/bulk/complete", response_model=dict)
 async def bulk_complete_tasks(
     task_ids: List[int],
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> dict:
     """
     Mark multiple tasks as completed in a single operation.
@@ -312,20 +471,21 @@ async def bulk_complete_tasks(
     Returns:
         dict: Summary of operation (updated count, failed IDs)
     """
-    updated_count = 0
-    failed_ids = []
-
-    for task_id in task_ids:
-        task = session.get(SpiritualTask, task_id)
-        if task:
-            task.completed = True
-            task.updated_at = datetime.utcnow()
-            session.add(task)
-            updated_count += 1
-        else:
-            failed_ids.append(task_id)
-
-    session.commit()
+    # One UPDATE for the whole batch; RETURNING tells us which IDs existed
+    # (updated_at is bumped by the database)
+    result = await session.exec(
+        update(SpiritualTask)
+        .where(col(SpiritualTask.id).in_(task_ids))
+        .values(completed=True)
+        .returning(SpiritualTask.id)
+        .execution_options(synchronize_session=False)
+    )
+    updated_ids = set(result.scalars().all())
+    await session.commit()
+    invalidate_tasks()
+
+    failed_ids = [task_id for task_id in task_ids if task_id not in updated_ids]
+    updated_count = len(task_ids) - len(failed_ids)
 
     return {
         "updated_count": updated_count,
@@ -337,7 +497,7 @@ async def bulk_complete_tasks(
 @router.delete("/bulk/delete", response_model=dict)
 async def bulk_delete_tasks(
     task_ids: List[int],
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> dict:
     """
     Delete multiple tasks in a single operation.
@@ -349,18 +509,19 @@ async def bulk_delete_tasks(
     Returns:
         dict: Summary of operation (deleted count, failed IDs)
     """
-    deleted_count = 0
-    failed_ids = []
-
-    for task_id in task_ids:
-        task = session.get(SpiritualTask, task_id)
-        if task:
-            session.delete(task)
-            deleted_count += 1
-        else:
-            failed_ids.append(task_id)
-
-    session.commit()
+    # One DELETE for the whole batch; RETURNING tells us which IDs existed
+    result = await session.exec(
+        delete(SpiritualTask)
+        .where(col(SpiritualTask.id).in_(task_ids))
+        .returning(SpiritualTask.id)
+        .execution_options(synchronize_session=False)
+    )
+    deleted_ids = set(result.scalars().all())
+    await session.commit()
+    invalidate_tasks()
+
+    failed_ids = [task_id for task_id in task_ids if task_id not in deleted_ids]
+    deleted_count = len(task_ids) - len(failed_ids)
 
     return {
         "deleted_count": deleted_count,
@@ -373,35 +534,56 @@ async def bulk_delete_tasks(
 # Search Endpoint
 # ============================================================================
 
-@router.get("/search/query", response_model=List[SpiritualTask])
+@router.get("/search/query", response_model=List[SpiritualTaskRead])
 async def search_tasks(
+    response: Response,
     q: str = Query(..., min_length=1, description="Search query string"),
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
 ) -> List[SpiritualTask]:
     """
-    Search tasks by title or description (case-insensitive).
+    Search tasks by title or description (case-insensitive), newest first.
 
     Args:
+        response: Outgoing response (carries the X-Next-Cursor header)
         q: Search query string
         session: Database session
         skip: Records to skip (pagination)
         limit: Maximum records to return
+        cursor: Resume after the last task of the previous page
 
     Returns:
         List[SpiritualTask]: Matching tasks
+
+    Raises:
+        HTTPException: 400 if the cursor is invalid
     """
+    cache_key = ("search", q, skip, limit, cursor)
+    tasks = task_cache.get(cache_key)
+    if tasks is not None:
+        _set_next_cursor(response, tasks, limit)
+        return tasks
+    generation = task_cache.generation  # Captured before reading, so a racing write wins
+
     # Build search query (case-insensitive partial match)
     search_pattern = f"%{q}%"
-    query = select(SpiritualTask).where(
+    query = select(*TASK_COLUMNS).where(
         or_(
             SpiritualTask.title.ilike(search_pattern),
             SpiritualTask.description.ilike(search_pattern)
         )
+    )
+    if cursor is not None:
+        query = _seek(query, cursor)
+    query = query.order_by(
+        col(SpiritualTask.created_at).desc(), col(SpiritualTask.id).desc()
     ).offset(skip).limit(limit)
 
-    tasks = session.exec(query).all()
+    tasks = [SpiritualTaskRead.model_validate(row) for row in (await session.exec(query)).mappings()]
+    task_cache.set(cache_key, tasks, generation=generation)
+    _set_next_cursor(response, tasks, limit)
     return tasks
 
 
@@ -409,42 +591,41 @@ async def search_tasks(
 # Advanced Query Endpoints
 # ============================================================================
 
-@router.get("/stats/summary", response_model=dict)
-async def get_task_statistics(
-    session: Session = Depends(get_session)
-) -> dict:
+async def _compute_task_statistics() -> dict:
     """
-    Get summary statistics about tasks.
+    Count tasks by completion state, category and priority.
+
+    Runs on its own session, since it may run in the background after the
+    request that triggered it has finished.
 
     Returns:
         dict: Statistics including total, completed, pending counts by category
     """
-    all_tasks = session.exec(select(SpiritualTask)).all()
-
-    total = len(all_tasks)
-    completed = sum(1 for t in all_tasks if t.completed)
+    # Count in the database: one row per (category, priority) pair
+    async with get_db_session() as session:
+        groups = (await session.exec(
+            select(
+                SpiritualTask.category,
+                SpiritualTask.priority,
+                func.count(),
+                func.sum(case((col(SpiritualTask.completed), 1), else_=0)),
+            ).group_by(SpiritualTask.category, SpiritualTask.priority)
+        )).all()
+
+    by_category = {category.value: {"total": 0, "completed": 0, "pending": 0} for category in TaskCategory}
+    by_priority = {priority.value: {"total": 0, "completed": 0, "pending": 0} for priority in Priority}
+
+    # Roll the pairs up into per-category and per-priority counts
+    for category, priority, group_total, group_completed in groups:
+        for counts in (by_category[category.value], by_priority[priority.value]):
+            counts["total"] += group_total
+            counts["completed"] += group_completed
+            counts["pending"] += group_total - group_completed
+
+    total = sum(counts["total"] for counts in by_category.values())
+    completed = sum(counts["completed"] for counts in by_category.values())
     pending = total - completed
 
-    # Group by category
-    by_category = {}
-    for category in TaskCategory:
-        category_tasks = [t for t in all_tasks if t.category == category]
-        by_category[category.value] = {
-            "total": len(category_tasks),
-            "completed": sum(1 for t in category_tasks if t.completed),
-            "pending": len(category_tasks) - sum(1 for t in category_tasks if t.completed)
-        }
-
-    # Group by priority
-    by_priority = {}
-    for priority in Priority:
-        priority_tasks = [t for t in all_tasks if t.priority == priority]
-        by_priority[priority.value] = {
-            "total": len(priority_tasks),
-            "completed": sum(1 for t in priority_tasks if t.completed),
-            "pending": len(priority_tasks) - sum(1 for t in priority_tasks if t.completed)
-        }
-
     return {
         "total": total,
         "completed": completed,
@@ -455,9 +636,24 @@ async def get_task_statistics(
     }
 
 
-@router.get("/upcoming", response_model=List[SpiritualTask])
+@router.get("/stats/summary", response_model=dict)
+async def get_task_statistics() -> dict:
+    """
+    Get summary statistics about tasks.
+
+    Served from cache; after a write the previous numbers are returned once
+    more while fresh ones are computed in the background, so they may lag
+    the latest write by a request.
+
+    Returns:
+        dict: Statistics including total, completed, pending counts by category
+    """
+    return await task_stats.get(_compute_task_statistics)
+
+
+@router.get("/upcoming", response_model=List[SpiritualTaskRead])
 async def get_upcoming_tasks(
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     days: int = Query(7, ge=1, le=30, description="Number of days to look ahead"),
     limit: int = Query(50, ge=1, le=500, description="Maximum tasks to return"),
 ) -> List[SpiritualTask]:
@@ -486,13 +682,13 @@ async def get_upcoming_tasks(
         )
     ).order_by(SpiritualTask.due_datetime.asc()).limit(limit)
 
-    tasks = session.exec(query).all()
+    tasks = (await session.exec(query)).all()
     return tasks
 
 
-@router.get("/overdue", response_model=List[SpiritualTask])
+@router.get("/overdue", response_model=List[SpiritualTaskRead])
 async def get_overdue_tasks(
-    session: Session = Depends(get_session),
+    session: AsyncSession = Depends(get_session),
     limit: int = Query(50, ge=1, le=500, description="Maximum tasks to return"),
 ) -> List[SpiritualTask]:
     """
@@ -515,5 +711,5 @@ async def get_overdue_tasks(
         )
     ).order_by(SpiritualTask.due_datetime.asc()).limit(limit)
 
-    tasks = session.exec(query).all()
+    tasks = (await session.exec(query)).all()
     return tasks
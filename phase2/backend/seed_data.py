@@ -8,36 +8,38 @@ Usage:
     python3 seed_data.py
 """
 
+import asyncio
 from datetime import datetime, timedelta
-from sqlmodel import Session, select
+from sqlalchemy import insert
+from sqlmodel import delete
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from database import engine
+from database import get_db_session, get_engine
 from models import (
     SpiritualTask, Masjid, DailyHadith,
     TaskCategory, Priority, Recurrence
 )
 
 
-def clear_existing_data(session: Session) -> None:
+async def clear_existing_data(session: AsyncSession) -> None:
     """Clear all existing data from the database."""
     print("🗑️  Clearing existing data...")
 
-    # Delete in order to respect foreign key constraints
-    for task in session.exec(select(SpiritualTask)).all():
-        session.delete(task)
+    # One DELETE per table, in order to respect foreign key constraints
+    for model in (SpiritualTask, Masjid, DailyHadith):
+        await session.exec(delete(model))
 
-    for masjid in session.exec(select(Masjid)).all():
-        session.delete(masjid)
-
-    for hadith in session.exec(select(DailyHadith)).all():
-        session.delete(hadith)
-
-    session.commit()
+    await session.commit()
     print("✅ Existing data cleared")
 
 
-def seed_masjids(session: Session) -> dict:
-    """Create sample masjid data."""
+async def seed_masjids(session: AsyncSession) -> dict:
+    """
+    Create sample masjid data.
+
+    Returns:
+        Mapping of masjid name to its new ID
+    """
     print("🕌 Seeding masjids...")
 
     masjids_data = [
@@ -83,26 +85,25 @@ def seed_masjids(session: Session) -> dict:
         },
     ]
 
-    masjids = {}
-    for data in masjids_data:
-        masjid = Masjid(**data)
-        masjid.created_at = datetime.utcnow()
-        masjid.updated_at = datetime.utcnow()
-        session.add(masjid)
-        session.commit()
-        session.refresh(masjid)
-        masjids[data["name"]] = masjid
-        print(f"  ✓ Created: {masjid.name}")
+    # One multi-row INSERT; timestamps come from the column server defaults
+    rows = await session.exec(
+        insert(Masjid).returning(Masjid.id, Masjid.name),
+        params=masjids_data,
+    )
+    masjids = {name: masjid_id for masjid_id, name in rows}
+    await session.commit()
+
+    for name in masjids:
+        print(f"  ✓ Created: {name}")
 
     print(f"✅ {len(masjids)} masjids seeded")
     return masjids
 
 
-def seed_tasks(session: Session, masjids: dict) -> None:
+async def seed_tasks(session: AsyncSession, masjids: dict) -> None:
     """Create sample spiritual task data."""
     print("📋 Seeding spiritual tasks...")
 
-    now = datetime.utcnow()
     today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
 
     tasks_data = [
@@ -112,7 +113,7 @@ def seed_tasks(session: Session, masjids: dict) -> None:
             "description": "Wake up 30 minutes early for tahajjud and wudu",
             "category": TaskCategory.FARZ,
             "priority": Priority.URGENT,
-            "masjid_id": masjids["Masjid Al-Huda"].id,
+            "masjid_id": masjids["Masjid Al-Huda"],
             "due_datetime": today + timedelta(days=1, hours=5, minutes=30),
             "recurrence": Recurrence.DAILY,
             "completed": False,
@@ -123,7 +124,7 @@ def seed_tasks(session: Session, masjids: dict) -> None:
             "description": "Friday congregation prayer at Central Jamia Masjid",
             "category": TaskCategory.FARZ,
             "priority": Priority.URGENT,
-            "masjid_id": masjids["Central Jamia Masjid"].id,
+            "masjid_id": masjids["Central Jamia Masjid"],
             "due_datetime": today + timedelta(days=(4 - today.weekday()) % 7, hours=13),
             "recurrence": Recurrence.WEEKLY,
             "completed": False,
@@ -178,7 +179,7 @@ def seed_tasks(session: Session, masjids: dict) -> None:
             "description": "Last 10 days of Ramadan I'tikaf",
             "category": TaskCategory.NAFL,
             "priority": Priority.LOW,
-            "masjid_id": masjids["Masjid Al-Noor"].id,
+            "masjid_id": masjids["Masjid Al-Noor"],
             "tags": "itikaf,ramadan,masjid"
         },
         {
@@ -208,7 +209,7 @@ def seed_tasks(session: Session, masjids: dict) -> None:
             "description": "Donate to Masjid Al-Farooq food program",
             "category": TaskCategory.DEED,
             "priority": Priority.MEDIUM,
-            "masjid_id": masjids["Masjid Al-Farooq"].id,
+            "masjid_id": masjids["Masjid Al-Farooq"],
             "due_datetime": today + timedelta(days=3),
             "completed": False,
             "tags": "charity,sadaqah,helping"
@@ -227,7 +228,7 @@ def seed_tasks(session: Session, masjids: dict) -> None:
             "description": "Saturday morning children's Quran class",
             "category": TaskCategory.DEED,
             "priority": Priority.MEDIUM,
-            "masjid_id": masjids["Masjid Baitul Mukarram"].id,
+            "masjid_id": masjids["Masjid Baitul Mukarram"],
             "due_datetime": today + timedelta(days=(5 - today.weekday()) % 7, hours=9),
             "recurrence": Recurrence.WEEKLY,
             "completed": False,
@@ -240,7 +241,7 @@ def seed_tasks(session: Session, masjids: dict) -> None:
             "description": "Completed Fajr at Masjid Al-Huda",
             "category": TaskCategory.FARZ,
             "priority": Priority.URGENT,
-            "masjid_id": masjids["Masjid Al-Huda"].id,
+            "masjid_id": masjids["Masjid Al-Huda"],
             "due_datetime": today + timedelta(hours=5, minutes=30),
             "completed": True,
             "tags": "prayer,fajr,masjid"
@@ -256,18 +257,16 @@ def seed_tasks(session: Session, masjids: dict) -> None:
         },
     ]
 
+    await session.exec(insert(SpiritualTask), params=tasks_data)
+    await session.commit()
+
     for data in tasks_data:
-        task = SpiritualTask(**data)
-        task.created_at = now
-        task.updated_at = now
-        session.add(task)
-        print(f"  ✓ Created: {task.title[:50]}...")
+        print(f"  ✓ Created: {data['title'][:50]}...")
 
-    session.commit()
     print(f"✅ {len(tasks_data)} spiritual tasks seeded")
 
 
-def seed_hadith(session: Session) -> None:
+async def seed_hadith(session: AsyncSession) -> None:
     """Create sample daily hadith data."""
     print("📖 Seeding daily hadith...")
 
@@ -311,30 +310,31 @@ def seed_hadith(session: Session) -> None:
         },
     ]
 
+    await session.exec(insert(DailyHadith), params=hadith_data)
+    await session.commit()
+
     for data in hadith_data:
-        hadith = DailyHadith(**data)
-        hadith.created_at = datetime.utcnow()
-        session.add(hadith)
         print(f"  ✓ Created hadith for: {data['date'].strftime('%Y-%m-%d')}")
 
-    session.commit()
     print(f"✅ {len(hadith_data)} hadith entries seeded")
 
 
-def main():
+async def main():
     """Main seeding function."""
     print("\n" + "=" * 60)
     print("  SalaatFlow Phase II - Database Seeding")
     print("=" * 60 + "\n")
 
-    with Session(engine) as session:
+    async with get_db_session() as session:
         # Clear existing data
-        clear_existing_data(session)
+        await clear_existing_data(session)
 
         # Seed in order (respecting foreign keys)
-        masjids = seed_masjids(session)
-        seed_tasks(session, masjids)
-        seed_hadith(session)
+        masjids = await seed_masjids(session)
+        await seed_tasks(session, masjids)
+        await seed_hadith(session)
+
+    await get_engine().dispose()
 
     print("\n" + "=" * 60)
     print("  ✅ Database seeding completed successfully!")
@@ -346,4 +346,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
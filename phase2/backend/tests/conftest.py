@@ -0,0 +1,29 @@
+"""
+Shared test fixtures
+
+The API runs against a throwaway SQLite database, created once per test
+session. DATABASE_URL must be set before the app is imported, since the
+engine and settings are built on first use and then cached.
+"""
+
+import os
+import tempfile
+
+_DB_DIR = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DB_DIR.name, 'test.db')}"
+os.environ["ENVIRONMENT"] = "serverless"  # No pooled connections shared across event loops
+os.environ["DEBUG"] = "false"
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import app
+
+API = "/api/v1"
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Test client with the app's startup (table creation) already run."""
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,55 @@
+"""
+Tests for the in-process response caches
+"""
+
+from cache import TTLCache
+
+
+def test_ttl_cache_stores_and_expires():
+    cache = TTLCache(ttl=60)
+    cache.set("key", [1])
+    cache.set("short", [2], ttl=-1)
+
+    assert cache.get("key") == [1]
+    assert cache.get("short") is None
+
+
+def test_clear_bumps_generation():
+    cache = TTLCache(ttl=60)
+    generation = cache.generation
+    cache.set("key", [1])
+
+    cache.clear()
+
+    assert cache.get("key") is None
+    assert cache.generation == generation + 1
+
+
+def test_value_read_before_a_clear_is_not_stored():
+    cache = TTLCache(ttl=60)
+    generation = cache.generation  # Read starts
+    cache.clear()                  # A write lands while it runs
+
+    cache.set("key", ["pre-write rows"], generation=generation)
+
+    assert cache.get("key") is None
+
+
+def test_value_read_without_a_clear_is_stored():
+    cache = TTLCache(ttl=60)
+    generation = cache.generation
+
+    cache.set("key", [1], generation=generation)
+
+    assert cache.get("key") == [1]
+
+
+def test_eviction_when_full_does_not_bump_generation():
+    cache = TTLCache(ttl=60, max_entries=1)
+    generation = cache.generation
+    cache.set("a", [1])
+
+    cache.set("b", [2], generation=generation)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == [2]
@@ -0,0 +1,209 @@
+"""
+Tests for conditional hadith GETs and the daily lookup cache
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date
+
+import httpx
+from sqlalchemy import event
+
+import routers.hadith as hadith_router
+from database import get_engine
+from main import app
+from tests.conftest import API
+
+
+def _create_hadith(client, day, translation="Actions are judged by intentions"):
+    response = client.post(f"{API}/hadith/", json={
+        "date": f"{day}T00:00:00",
+        "arabic_text": "إنما الأعمال بالنيات",
+        "english_translation": translation,
+        "reference": "Sahih Bukhari 1",
+    })
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+# ============================================================================
+# ETag / 304 Not Modified
+# ============================================================================
+
+def test_daily_hadith_answers_matching_etag_with_304(client):
+    _create_hadith(client, "2030-01-01")
+    params = {"date_param": "2030-01-01"}
+
+    first = client.get(f"{API}/hadith/daily", params=params)
+    etag = first.headers["ETag"]
+    repeat = client.get(f"{API}/hadith/daily", params=params, headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert repeat.status_code == 304
+    assert repeat.content == b""
+    assert repeat.headers["ETag"] == etag
+
+
+def test_hadith_by_id_accepts_weak_and_listed_etags(client):
+    hadith = _create_hadith(client, "2030-01-02")
+    etag = client.get(f"{API}/hadith/{hadith['id']}").headers["ETag"]
+
+    for if_none_match in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        response = client.get(f"{API}/hadith/{hadith['id']}", headers={"If-None-Match": if_none_match})
+        assert response.status_code == 304, if_none_match
+
+    response = client.get(f"{API}/hadith/{hadith['id']}", headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
+
+
+def test_matching_etag_is_answered_without_loading_the_row(client):
+    hadith = _create_hadith(client, "2030-01-08")
+    etag = client.get(f"{API}/hadith/{hadith['id']}").headers["ETag"]
+    statements = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = get_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get(f"{API}/hadith/{hadith['id']}", headers={"If-None-Match": etag})
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert response.status_code == 304
+    assert len(statements) == 1
+    assert "arabic_text" not in statements[0]
+
+
+def test_update_changes_the_etag(client):
+    hadith = _create_hadith(client, "2030-01-03")
+    params = {"date_param": "2030-01-03"}
+    old_etag = client.get(f"{API}/hadith/daily", params=params).headers["ETag"]
+
+    client.put(f"{API}/hadith/{hadith['id']}", json={"english_translation": "Updated translation"})
+    response = client.get(f"{API}/hadith/daily", params=params, headers={"If-None-Match": old_etag})
+
+    assert response.status_code == 200
+    assert response.json()["english_translation"] == "Updated translation"
+    assert response.headers["ETag"] != old_etag
+
+
+# ============================================================================
+# Daily Lookup Cache
+# ============================================================================
+
+def test_lookup_overlapping_a_write_is_not_cached(client, monkeypatch):
+    _create_hadith(client, "2030-01-05")
+    hadith_router._daily_cache.clear()
+    get_db_session = hadith_router.get_db_session
+
+    @asynccontextmanager
+    async def session_racing_a_write():
+        async with get_db_session() as session:
+            yield session
+        hadith_router._invalidate_daily()  # A write commits while the lookup finishes
+
+    monkeypatch.setattr(hadith_router, "get_db_session", session_racing_a_write)
+    response = client.get(f"{API}/hadith/daily", params={"date_param": "2030-01-05"})
+
+    assert response.status_code == 200
+    assert date(2030, 1, 5) not in hadith_router._daily_cache
+
+
+def test_lookup_without_a_write_is_cached(client):
+    _create_hadith(client, "2030-01-06")
+
+    client.get(f"{API}/hadith/daily", params={"date_param": "2030-01-06"})
+
+    assert date(2030, 1, 6) in hadith_router._daily_cache
+
+
+# ============================================================================
+# Coalesced Daily Lookups
+# ============================================================================
+
+def test_concurrent_daily_misses_share_one_lookup(client, monkeypatch):
+    _create_hadith(client, "2030-01-04")
+    hadith_router._daily_cache.clear()
+    lookups = []
+    load_daily = hadith_router._load_daily
+
+    async def counting_load_daily(target_date):
+        lookups.append(target_date)
+        await asyncio.sleep(0.05)  # Keep the lookup in flight while the others arrive
+        return await load_daily(target_date)
+
+    monkeypatch.setattr(hadith_router, "_load_daily", counting_load_daily)
+
+    async def fetch_concurrently():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+            return await asyncio.gather(*(
+                async_client.get(f"{API}/hadith/daily", params={"date_param": "2030-01-04"})
+                for _ in range(10)
+            ))
+
+    responses = asyncio.run(fetch_concurrently())
+
+    assert [response.status_code for response in responses] == [200] * 10
+    assert len({response.headers["ETag"] for response in responses}) == 1
+    assert len(lookups) == 1
+    assert hadith_router._daily_inflight == {}
+
+
+def test_missing_day_is_404_and_not_left_in_flight(client):
+    response = client.get(f"{API}/hadith/daily", params={"date_param": "2031-06-01"})
+
+    assert response.status_code == 404
+    assert hadith_router._daily_inflight == {}
+
+
+def test_write_during_an_in_flight_lookup_is_not_lost(client, monkeypatch):
+    hadith = _create_hadith(client, "2030-01-07", translation="Before the write")
+    hadith_router._daily_cache.clear()
+    params = {"date_param": "2030-01-07"}
+    get_db_session = hadith_router.get_db_session
+    sessions = []
+
+    async def interleave():
+        queried, release = asyncio.Event(), asyncio.Event()
+
+        @asynccontextmanager
+        async def held_first_session():
+            sessions.append(1)
+            first = len(sessions) == 1
+            async with get_db_session() as session:
+                yield session
+            if first:
+                # The first lookup has read the old row; hold it until the write is done
+                queried.set()
+                await release.wait()
+
+        monkeypatch.setattr(hadith_router, "get_db_session", held_first_session)
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+            before = asyncio.ensure_future(async_client.get(f"{API}/hadith/daily", params=params))
+            await queried.wait()
+
+            await async_client.put(
+                f"{API}/hadith/{hadith['id']}", json={"english_translation": "After the write"}
+            )
+            # Joining the held pre-write lookup would never finish
+            after = await asyncio.wait_for(
+                async_client.get(f"{API}/hadith/daily", params=params), timeout=5
+            )
+
+            release.set()
+            await before
+            latest = await async_client.get(f"{API}/hadith/daily", params=params)
+            return before.result(), after, latest
+
+    before, after, latest = asyncio.run(interleave())
+
+    assert before.json()["english_translation"] == "Before the write"
+    assert after.json()["english_translation"] == "After the write"
+    assert latest.json()["english_translation"] == "After the write"
+    assert len(sessions) == 2
+    assert hadith_router._daily_inflight == {}
@@ -0,0 +1,21 @@
+"""
+Tests for masjid listing
+"""
+
+from tests.conftest import API
+
+
+def test_sort_order_is_case_insensitive_and_falls_back_to_ascending(client):
+    for name in ("Masjid Sort B", "Masjid Sort A", "Masjid Sort C"):
+        client.post(f"{API}/masjids/", json={"name": name, "area": "Sort Test"})
+    params = {"area": "Sort Test", "sort_by": "name"}
+
+    def names(sort_order):
+        response = client.get(f"{API}/masjids/", params=dict(params, sort_order=sort_order))
+        assert response.status_code == 200, response.text
+        return [masjid["name"] for masjid in response.json()]
+
+    ascending = ["Masjid Sort A", "Masjid Sort B", "Masjid Sort C"]
+    assert names("DESC") == ascending[::-1]
+    assert names("asc") == ascending
+    assert names("sideways") == ascending
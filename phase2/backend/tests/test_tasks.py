@@ -0,0 +1,157 @@
+"""
+Tests for task list pagination, caching and minimal write responses
+"""
+
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from database import get_engine
+from routers.tasks import NEXT_CURSOR_HEADER, _decode_cursor, _encode_cursor
+from tests.conftest import API
+
+
+def _create_task(client, title, **fields):
+    response = client.post(f"{API}/tasks/", json={"title": title, **fields})
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def _all_pages(client, path, params):
+    """Follow X-Next-Cursor until the last page, returning every task seen."""
+    tasks, cursor = [], None
+    while True:
+        page_params = dict(params, cursor=cursor) if cursor else params
+        response = client.get(f"{API}{path}", params=page_params)
+        assert response.status_code == 200, response.text
+        tasks += response.json()
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            return tasks
+
+
+# ============================================================================
+# Keyset Pagination
+# ============================================================================
+
+def test_cursor_round_trip():
+    class Task:
+        created_at = datetime(2026, 1, 2, 3, 4, 5, 678)
+        id = 42
+
+    assert _decode_cursor(_encode_cursor(Task)) == (Task.created_at, 42)
+
+
+@pytest.mark.parametrize("cursor", ["junk", "2026-01-01T00:00:00_x", "_7"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        _decode_cursor(cursor)
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.parametrize("sort_order", ["desc", "asc"])
+def test_cursor_pages_cover_every_task_once(client, sort_order):
+    ids = [_create_task(client, f"Page {sort_order} {i}", description="keyset")["id"] for i in range(7)]
+
+    tasks = _all_pages(client, "/tasks/", {"limit": 3, "sort_order": sort_order})
+    seen = [task["id"] for task in tasks if task["id"] in ids]
+
+    assert seen == (sorted(ids) if sort_order == "asc" else sorted(ids, reverse=True))
+    keys = [(task["created_at"], task["id"]) for task in tasks]
+    assert keys == sorted(keys, reverse=sort_order == "desc")
+
+
+def test_search_cursor_pages_cover_every_match_once(client):
+    ids = {_create_task(client, f"Tahajjud {i}")["id"] for i in range(5)}
+
+    tasks = _all_pages(client, "/tasks/search/query", {"q": "tahajj", "limit": 2})
+
+    assert sorted(task["id"] for task in tasks) == sorted(ids)
+
+
+def test_invalid_cursor_returns_400(client):
+    assert client.get(f"{API}/tasks/", params={"cursor": "junk"}).status_code == 400
+
+
+# ============================================================================
+# Response Cache
+# ============================================================================
+
+def test_list_cache_is_cleared_by_writes(client):
+    masjid = client.post(f"{API}/masjids/", json={"name": "Masjid Ishraq", "area": "Clifton"}).json()
+    params = {"masjid_id": masjid["id"]}
+    assert client.get(f"{API}/tasks/", params=params).json() == []
+
+    task = _create_task(client, "Ishraq", masjid_id=masjid["id"])
+    assert [t["id"] for t in client.get(f"{API}/tasks/", params=params).json()] == [task["id"]]
+
+    client.patch(f"{API}/tasks/{task['id']}/complete")
+    assert client.get(f"{API}/tasks/", params=params).json()[0]["completed"] is True
+
+    client.put(f"{API}/tasks/{task['id']}", json={"title": "Ishraq prayer"})
+    assert client.get(f"{API}/tasks/", params=params).json()[0]["title"] == "Ishraq prayer"
+
+    client.delete(f"{API}/tasks/{task['id']}")
+    assert client.get(f"{API}/tasks/", params=params).json() == []
+
+
+def test_search_cache_is_cleared_by_writes(client):
+    params = {"q": "Duha"}
+    assert client.get(f"{API}/tasks/search/query", params=params).json() == []
+
+    task = _create_task(client, "Duha")
+    assert [t["id"] for t in client.get(f"{API}/tasks/search/query", params=params).json()] == [task["id"]]
+
+    client.post(f"{API}/tasks/bulk/complete", json=[task["id"]])
+    assert client.get(f"{API}/tasks/search/query", params=params).json()[0]["completed"] is True
+
+
+def test_repeated_reads_are_served_from_cache(client):
+    task = _create_task(client, "Awwabin")
+    params = {"q": "Awwabin"}
+    statements = []
+
+    def count(*args):
+        statements.append(args[2])
+
+    engine = get_engine().sync_engine
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        first = client.get(f"{API}/tasks/search/query", params=params).json()
+        queried = len(statements)
+        second = client.get(f"{API}/tasks/search/query", params=params).json()
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+
+    assert [t["id"] for t in first] == [task["id"]]
+    assert second == first
+    assert queried > 0
+    assert len(statements) == queried
+
+
+# ============================================================================
+# Minimal Responses
+# ============================================================================
+
+def test_prefer_return_minimal_skips_the_body(client):
+    task = _create_task(client, "Witr")
+
+    response = client.patch(
+        f"{API}/tasks/{task['id']}/complete", headers={"Prefer": "return=minimal"}
+    )
+
+    assert response.status_code == 204
+    assert response.content == b""
+    assert response.headers["Preference-Applied"] == "return=minimal"
+    assert client.get(f"{API}/tasks/{task['id']}").json()["completed"] is True
+
+
+def test_full_row_is_returned_by_default(client):
+    task = _create_task(client, "Sunnah of Fajr")
+
+    response = client.put(f"{API}/tasks/{task['id']}", json={"title": "Fajr sunnah"})
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "Fajr sunnah"
@@ -1 +1 @@
-"""Agent module for OpenAI Agents SDK integration"""
+"""Agent module: intent detection, tool calls and Gemini responses"""
@@ -7,149 +7,165 @@ Uses simple conversation mode with manual intent detection for tool calling
 import json
 import logging
 import re
+from functools import lru_cache
 from typing import List, Dict, Optional
 
-from chatbot.agent.config import AGENT_CONFIG
 from chatbot.agent.prompts import SYSTEM_PROMPT
-from chatbot.mcp_tools import execute_tool
+from chatbot.mcp_tools import aexecute_tool
 
 logger = logging.getLogger(__name__)
 
-
-def initialize_agent():
+# Task intent patterns, checked in order (first match wins). Each intent's
+# alternatives are fused into one pattern compiled once at import, so a
+# message costs one scan per intent instead of one per alternative.
+# Every alternative needs the literal "task", so a message without it
+# skips all of them.
+TASK_INTENT_PATTERNS = (
+    ("create_task", re.compile(
+        r'task\s+(?:create|bana|add|new)'
+        r'|(?:bana|create|add)\s+.*task'
+        r'|namaz.*task'
+        r'|(?:fajr|dhuhr|asr|maghrib|isha).*task'
+    )),
+    ("update_task", re.compile(
+        r'task\s+(?:update|edit|change|modify)'
+        r'|(?:complete|done|finish).*task'
+        r'|urgent.*task'
+        r'|task.*urgent'
+    )),
+    ("delete_task", re.compile(
+        r'task\s+(?:delete|remove|cancel)'
+        r'|(?:delete|remove|cancel).*task'
+    )),
+    ("list_tasks", re.compile(
+        r'(?:show|display|list|dikhao).*task'
+        r'|task.*list'
+        r'|mery\s+task'
+        r'|konse\s+task'
+    )),
+)
+
+# Masjid search, checked after the task intents; every alternative needs
+# "masjid" or "namaz"
+MASJID_SEARCH_PATTERN = re.compile(
+    r'masjid.*search'
+    r'|konsi\s+masjid'
+    r'|masjid.*area'
+    r'|namaz.*kahan'
+)
+
+# Parameter extraction patterns
+TIME_PATTERN = re.compile(r'(\d{1,2}):(\d{2})')
+AREA_PATTERN = re.compile(r'(North Nazimabad|DHA|Clifton|Gulshan|Malir)', re.IGNORECASE)
+TITLE_TRIGGER_WORDS = re.compile(r'\b(?:task|bana|create|add|do|kr|ka|ki)\b', re.IGNORECASE)
+WHITESPACE_RUN = re.compile(r'\s+')
+WORD = re.compile(r'[a-z]+')
+
+# Keyword vocabularies, matched against whole words of the message
+PRAYERS = ('fajr', 'dhuhr', 'asr', 'maghrib', 'isha')
+HIGH_PRIORITY_WORDS = frozenset(('urgent', 'zaruri', 'important'))
+LOW_PRIORITY_WORDS = frozenset(('low', 'kam'))
+
+# Chat roles as Gemini names them (any other role is sent as "user")
+GEMINI_ROLES = {"assistant": "model", "model": "model"}
+
+
+@lru_cache(maxsize=1024)
+def _classify_intent(msg_lower: str) -> str:
     """
-    Initialize Google Gemini model for simple conversation
+    Classify a lowercased message into an intent name
 
-    Returns:
-        None (agent initialization now handled by GeminiClient)
+    Task intents are tried in TASK_INTENT_PATTERNS order, then masjid search;
+    anything else is conversation. Each group's patterns only run when the
+    message contains the keyword they all require. Results are cached, since
+    short phrases ("show tasks", "haan") repeat often.
 
-    Note: This function is kept for backward compatibility but is no longer needed.
-    The GeminiClient is now initialized in the router's startup event.
+    Args:
+        msg_lower: Lowercased user message
+
+    Returns:
+        Intent name
     """
-    logger.info("Agent initialization is now handled by GeminiClient")
-    return None
+    if 'task' in msg_lower:
+        for intent, pattern in TASK_INTENT_PATTERNS:
+            if pattern.search(msg_lower):
+                return intent
 
+    if ('masjid' in msg_lower or 'namaz' in msg_lower) and MASJID_SEARCH_PATTERN.search(msg_lower):
+        return "search_masjids"
 
-def detect_intent(user_message: str) -> Dict[str, any]:
+    return "conversation"
+
+
+def detect_intent(user_message: str, msg_lower: Optional[str] = None) -> Dict[str, any]:
     """
     Detect user intent from message using keyword matching
 
     Args:
         user_message: User's message
+        msg_lower: The message already lowercased, if the caller has it
 
     Returns:
         Dict with intent type and extracted parameters
     """
-    msg_lower = user_message.lower()
+    if msg_lower is None:
+        msg_lower = user_message.lower()
+    return {"intent": _classify_intent(msg_lower), "message": user_message}
 
-    # Task creation patterns
-    create_patterns = [
-        r'task\s+(create|bana|add|new)',
-        r'(bana|create|add)\s+.*task',
-        r'namaz.*task',
-        r'(fajr|dhuhr|asr|maghrib|isha).*task',
-    ]
-
-    # Task update patterns
-    update_patterns = [
-        r'task\s+(update|edit|change|modify)',
-        r'(complete|done|finish).*task',
-        r'urgent.*task',
-        r'task.*urgent',
-    ]
-
-    # Task deletion patterns
-    delete_patterns = [
-        r'task\s+(delete|remove|cancel)',
-        r'(delete|remove|cancel).*task',
-    ]
-
-    # Task list patterns
-    list_patterns = [
-        r'(show|display|list|dikhao).*task',
-        r'task.*list',
-        r'mery\s+task',
-        r'konse\s+task',
-    ]
-
-    # Masjid search patterns
-    masjid_patterns = [
-        r'masjid.*search',
-        r'konsi\s+masjid',
-        r'masjid.*area',
-        r'namaz.*kahan',
-    ]
-
-    # Check each pattern type
-    for pattern in create_patterns:
-        if re.search(pattern, msg_lower):
-            return {"intent": "create_task", "message": user_message}
-
-    for pattern in update_patterns:
-        if re.search(pattern, msg_lower):
-            return {"intent": "update_task", "message": user_message}
-
-    for pattern in delete_patterns:
-        if re.search(pattern, msg_lower):
-            return {"intent": "delete_task", "message": user_message}
-
-    for pattern in list_patterns:
-        if re.search(pattern, msg_lower):
-            return {"intent": "list_tasks", "message": user_message}
-
-    for pattern in masjid_patterns:
-        if re.search(pattern, msg_lower):
-            return {"intent": "search_masjids", "message": user_message}
-
-    return {"intent": "conversation", "message": user_message}
-
-
-def extract_task_params(user_message: str, intent_type: str) -> Dict[str, any]:
+
+def extract_task_params(
+    user_message: str,
+    intent_type: str,
+    msg_lower: Optional[str] = None
+) -> Dict[str, any]:
     """
     Extract task parameters from user message
 
     Args:
         user_message: User's message
         intent_type: Type of intent detected
+        msg_lower: The message already lowercased, if the caller has it
 
     Returns:
         Dict with extracted parameters
     """
     params = {}
-    msg_lower = user_message.lower()
+    if msg_lower is None:
+        msg_lower = user_message.lower()
+
+    # Tokenize once; keyword checks are then set lookups on whole words
+    # (so "fajrabad" isn't taken as Fajr, nor "follow" as low priority)
+    words = set(WORD.findall(msg_lower))
 
     # Extract prayer names
-    prayers = ['fajr', 'dhuhr', 'asr', 'maghrib', 'isha']
-    for prayer in prayers:
-        if prayer in msg_lower:
+    for prayer in PRAYERS:
+        if prayer in words:
             params['linked_prayer'] = prayer.capitalize()
             break
 
     # Extract priority keywords
-    if any(word in msg_lower for word in ['urgent', 'zaruri', 'important']):
+    if not words.isdisjoint(HIGH_PRIORITY_WORDS):
         params['priority'] = 'high'
-    elif any(word in msg_lower for word in ['low', 'kam']):
+    elif not words.isdisjoint(LOW_PRIORITY_WORDS):
         params['priority'] = 'low'
     else:
         params['priority'] = 'medium'
 
     # Extract time patterns
-    time_match = re.search(r'(\d{1,2}):(\d{2})', user_message)
+    time_match = TIME_PATTERN.search(user_message)
     if time_match:
         params['time'] = f"{time_match.group(1)}:{time_match.group(2)}"
 
     # Extract task title (for creation)
     if intent_type == "create_task":
-        # Remove common trigger words to get title
-        title = user_message
-        for word in ['task', 'bana', 'create', 'add', 'do', 'kr', 'ka', 'ki']:
-            title = re.sub(rf'\b{word}\b', '', title, flags=re.IGNORECASE)
-        params['title'] = title.strip()
+        # Remove common trigger words to get title, closing the gaps they leave
+        title = TITLE_TRIGGER_WORDS.sub('', user_message)
+        params['title'] = WHITESPACE_RUN.sub(' ', title).strip()
 
     return params
 
 
-def run_agent(
+async def run_agent(
     agent,
     user_id: int,
     user_message: str,
@@ -177,26 +193,25 @@ def run_agent(
         GeminiNetworkError: If network error occurs
         GeminiError: For other Gemini API errors
     """
-    log_extra = {"request_id": request_id} if request_id else {}
+    # Bind the request ID once instead of passing extra= on every call
+    log = logging.LoggerAdapter(logger, {"request_id": request_id}) if request_id else logger
 
-    logger.info(
-        f"Running Gemini agent for user {user_id}: {user_message[:50]}...",
-        extra=log_extra
-    )
+    log.info("Running Gemini agent for user %s: %.50s...", user_id, user_message)
 
-    # Detect user intent first
-    intent_data = detect_intent(user_message)
+    # Detect user intent first (lowercasing once for both intent and params)
+    msg_lower = user_message.lower()
+    intent_data = detect_intent(user_message, msg_lower)
     intent = intent_data["intent"]
 
-    logger.info(f"Detected intent: {intent}", extra=log_extra)
+    log.info("Detected intent: %s", intent)
 
     # Handle task operations with direct tool calling
     if intent == "create_task":
-        params = extract_task_params(user_message, intent)
-        logger.info(f"Creating task with params: {params}", extra=log_extra)
+        params = extract_task_params(user_message, intent, msg_lower)
+        log.info("Creating task with params: %s", params)
 
         # Call create_task tool directly
-        result = execute_tool(
+        result = await aexecute_tool(
             "create_task",
             user_id,
             title=params.get('title', 'New Task'),
@@ -212,21 +227,22 @@ def run_agent(
             return f"❌ Failed to create task: {result.get('error', 'Unknown error')}"
 
     elif intent == "list_tasks":
-        logger.info("Listing tasks for user", extra=log_extra)
-        result = execute_tool("list_tasks", user_id)
+        log.info("Listing tasks for user")
+        result = await aexecute_tool("list_tasks", user_id)
 
         if result.get('success'):
             tasks = result.get('tasks', [])
             if not tasks:
                 return "You don't have any tasks yet. Would you like to create one?"
 
-            response = f"📋 Your Tasks ({len(tasks)} total):\n\n"
+            # Collect the parts and join once, rather than regrowing a string per task
+            parts = [f"📋 Your Tasks ({len(tasks)} total):\n\n"]
             for i, task in enumerate(tasks, 1):
                 status = "✅" if task.get('completed') else "⏳"
                 prayer = f" ({task.get('linked_prayer')})" if task.get('linked_prayer') else ""
-                response += f"{i}. {status} {task.get('title')}{prayer}\n   Priority: {task.get('priority')}\n\n"
+                parts.append(f"{i}. {status} {task.get('title')}{prayer}\n   Priority: {task.get('priority')}\n\n")
 
-            return response
+            return "".join(parts)
         else:
             return f"❌ Failed to fetch tasks: {result.get('error', 'Unknown error')}"
 
@@ -240,65 +256,55 @@ def run_agent(
 
     elif intent == "search_masjids":
         # Extract area from message
-        area_match = re.search(r'(North Nazimabad|DHA|Clifton|Gulshan|Malir)', user_message, re.IGNORECASE)
+        area_match = AREA_PATTERN.search(user_message)
         area = area_match.group(1) if area_match else None
 
-        result = execute_tool("search_masjids", user_id, area=area)
+        result = await aexecute_tool("search_masjids", user_id, area=area)
 
         if result.get('success'):
             masjids = result.get('masjids', [])
             if not masjids:
                 return f"No masjids found{' in ' + area if area else ''}."
 
-            response = f"🕌 Found {len(masjids)} masjid(s){' in ' + area if area else ''}:\n\n"
+            parts = [f"🕌 Found {len(masjids)} masjid(s){' in ' + area if area else ''}:\n\n"]
             for i, masjid in enumerate(masjids, 1):
-                response += f"{i}. {masjid.get('name')}\n"
-                response += f"   Area: {masjid.get('area_name')}, {masjid.get('city')}\n"
-                response += f"   Fajr: {masjid.get('fajr_time')} | Dhuhr: {masjid.get('dhuhr_time')}\n\n"
+                parts.append(
+                    f"{i}. {masjid.get('name')}\n"
+                    f"   Area: {masjid.get('area_name')}, {masjid.get('city')}\n"
+                    f"   Fajr: {masjid.get('fajr_time')} | Dhuhr: {masjid.get('dhuhr_time')}\n\n"
+                )
 
-            return response
+            return "".join(parts)
         else:
             return f"❌ Failed to search masjids: {result.get('error', 'Unknown error')}"
 
     # For general conversation, use Gemini
     else:
         if gemini_client is None:
-            logger.error("GeminiClient not provided to agent", extra=log_extra)
+            log.error("GeminiClient not provided to agent")
             raise ValueError("GeminiClient is required for conversation mode")
 
-        # Build conversation context for Gemini
-        conversation_context = ""
+        # Send history as separate turns, so the request starts with the same
+        # system instruction every time and Gemini can reuse its cached prefix
         if conversation_history:
-            for msg in conversation_history:
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-                conversation_context += f"{role.upper()}: {content}\n"
-            conversation_context += f"USER: {user_message}\n"
+            conversation_context = [
+                {"role": GEMINI_ROLES.get(msg.get("role"), "user"), "parts": [msg["content"]]}
+                for msg in conversation_history
+                if msg.get("content")
+            ]
+            conversation_context.append({"role": "user", "parts": [user_message]})
         else:
             conversation_context = user_message
 
         # Use GeminiClient to generate response
-        logger.debug(
-            f"Generating response with GeminiClient",
-            extra=log_extra
-        )
+        log.debug("Generating response with GeminiClient")
 
-        response_text = gemini_client.generate_response(
+        response_text = await gemini_client.agenerate_response(
             prompt=conversation_context,
             system_instruction=SYSTEM_PROMPT,
             context={"request_id": request_id, "user_id": user_id}
         )
 
-        logger.info(
-            f"Gemini response generated: {len(response_text)} chars",
-            extra=log_extra
-        )
+        log.info("Gemini response generated: %d chars", len(response_text))
 
         return response_text
-
-
-def cleanup_agent():
-    """
-    Cleanup agent resources (not needed for Gemini)
-    """
-    logger.info("Gemini model is stateless, no cleanup needed")
@@ -4,39 +4,79 @@ Loads Phase III environment variables for AI-powered features
 Now using Google Gemini (FREE!)
 """
 
+import logging
 import os
-from typing import Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
+
 from dotenv import load_dotenv
 
-# Load .env file from backend directory
-backend_dir = Path(__file__).parent.parent.parent
-env_path = backend_dir / ".env"
-load_dotenv(dotenv_path=env_path)
-
-# Required settings - Gemini API Key
-GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-if not GEMINI_API_KEY:
-    raise ValueError(
-        "GEMINI_API_KEY environment variable is required for Phase III chatbot functionality. "
-        "Please set it in your .env file. Get your FREE API key from: https://aistudio.google.com/app/apikey"
-    )
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class ChatbotSettings:
+    """Chatbot settings, parsed once from the environment"""
+
+    # Required settings - Gemini API Key
+    gemini_api_key: str = field(repr=False)
+
+    # Backend integration
+    backend_base_url: str
+
+    # Agent configuration
+    model: str
+    temperature: float
+    max_tokens: int
+    timeout: int
 
-# Backend integration
-BACKEND_BASE_URL = os.getenv("BACKEND_BASE_URL", "http://localhost:8000")
+    # User preferences (optional defaults)
+    default_area: Optional[str]
+    default_masjid_id: Optional[int]
 
-# Agent configuration
-CHATBOT_MODEL = os.getenv("CHATBOT_MODEL", "gemini-1.5-flash")  # Free Gemini model
-CHATBOT_TEMPERATURE = float(os.getenv("CHATBOT_TEMPERATURE", "0.7"))
-CHATBOT_MAX_TOKENS = int(os.getenv("CHATBOT_MAX_TOKENS", "1000"))
-CHATBOT_TIMEOUT = int(os.getenv("CHATBOT_TIMEOUT", "30"))
 
-# User preferences (optional defaults)
-DEFAULT_AREA: Optional[str] = os.getenv("DEFAULT_AREA")
-DEFAULT_MASJID_ID: Optional[int] = int(os.getenv("DEFAULT_MASJID_ID")) if os.getenv("DEFAULT_MASJID_ID") else None
+@lru_cache(maxsize=1)
+def get_settings() -> ChatbotSettings:
+    """
+    Load chatbot settings on first use
 
-# Validation
-print(f"✅ Chatbot settings loaded (Google Gemini):")
-print(f"   Model: {CHATBOT_MODEL}")
-print(f"   Backend: {BACKEND_BASE_URL}")
-print(f"   API Key: {'Set ✅' if GEMINI_API_KEY else 'Missing ❌'}")
+    Importing this module has no side effects; .env is read and the
+    environment parsed only on the first call, which later calls reuse.
+    Variables already in the environment take precedence over .env.
+
+    Returns:
+        Cached ChatbotSettings
+
+    Raises:
+        ValueError: If GEMINI_API_KEY is not set
+    """
+    # .env file in the backend directory; override=False keeps existing variables
+    load_dotenv(dotenv_path=Path(__file__).parent.parent.parent / ".env", override=False)
+
+    gemini_api_key = os.getenv("GEMINI_API_KEY")
+    if not gemini_api_key:
+        raise ValueError(
+            "GEMINI_API_KEY environment variable is required for Phase III chatbot functionality. "
+            "Please set it in your .env file. Get your FREE API key from: https://aistudio.google.com/app/apikey"
+        )
+
+    default_masjid_id = os.getenv("DEFAULT_MASJID_ID")
+
+    settings = ChatbotSettings(
+        gemini_api_key=gemini_api_key,
+        backend_base_url=os.getenv("BACKEND_BASE_URL", "http://localhost:8000"),
+        model=os.getenv("CHATBOT_MODEL", "gemini-1.5-flash"),  # Free Gemini model
+        temperature=float(os.getenv("CHATBOT_TEMPERATURE", "0.7")),
+        max_tokens=int(os.getenv("CHATBOT_MAX_TOKENS", "1000")),
+        timeout=int(os.getenv("CHATBOT_TIMEOUT", "30")),
+        default_area=os.getenv("DEFAULT_AREA"),
+        default_masjid_id=int(default_masjid_id) if default_masjid_id else None,
+    )
+
+    logger.info(
+        "Chatbot settings loaded (Google Gemini): model %s, backend %s",
+        settings.model, settings.backend_base_url
+    )
+    return settings
@@ -0,0 +1,138 @@
+"""
+Gemini Response Cache
+
+Caches generated text for repeated, deterministic prompts so they skip
+the Gemini API round-trip entirely.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Protocol, Tuple, Union
+
+
+class CacheBackend(Protocol):
+    """Storage for cached responses, keyed by cache_key()."""
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached text, or None if missing or expired."""
+        ...
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """Store text for ttl seconds."""
+        ...
+
+    async def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        ...
+
+
+def cache_key(
+    model: str,
+    system_instruction: Optional[str],
+    prompt: Union[str, List[Dict[str, Any]]],
+    temperature: Optional[float],
+) -> Optional[str]:
+    """
+    Build the cache key for a request.
+
+    Only deterministic requests (temperature 0) are cacheable; sampling at
+    any other temperature is meant to vary, so it gets no key.
+
+    Args:
+        model: Gemini model name
+        system_instruction: System instruction sent with the prompt
+        prompt: Prompt text or list of conversation turns
+        temperature: Sampling temperature (None means the model default)
+
+    Returns:
+        SHA-256 hex digest of the request, or None if it must not be cached
+    """
+    if temperature is None or temperature > 0:
+        return None
+
+    payload = json.dumps(
+        {"model": model, "system_instruction": system_instruction, "prompt": prompt},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LRUCache:
+    """
+    In-process cache evicting the least recently used entry when full.
+
+    Each worker process keeps its own copy.
+    """
+
+    def __init__(self, max_size: int = 512):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of entries kept
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached text, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """Store text for ttl seconds, evicting the oldest entry if full."""
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        self._entries.pop(key, None)
+
+
+class RedisCache:
+    """
+    Cache shared by all workers, stored in Redis.
+
+    Requires the optional ``redis`` package (redis.asyncio).
+    """
+
+    def __init__(self, url: str, prefix: str = "gemini:"):
+        """
+        Connect lazily to Redis.
+
+        Args:
+            url: Redis connection URL (redis://host:port/db)
+            prefix: Prefix for every key this cache writes
+        """
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise ImportError(
+                "RedisCache requires the 'redis' package. Install it with: pip install redis"
+            ) from e
+
+        self._redis = redis_asyncio.from_url(url, decode_responses=True)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached text, or None if missing or expired."""
+        return await self._redis.get(self.prefix + key)
+
+    async def set(self, key: str, value: str, ttl: float) -> None:
+        """Store text for ttl seconds."""
+        await self._redis.set(self.prefix + key, value, ex=max(1, int(ttl)))
+
+    async def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        await self._redis.delete(self.prefix + key)
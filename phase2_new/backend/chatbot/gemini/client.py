@@ -4,13 +4,18 @@ Robust Google Gemini API Client
 Provides error handling, retry logic, and logging for Gemini API calls.
 """
 
+import asyncio
+import json
+import random
 import time
 import logging
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Union
 
 import google.generativeai as genai
 from google.api_core import exceptions as google_exceptions
 
+from .cache import CacheBackend, LRUCache, RedisCache, cache_key
 from .config import GeminiConfig
 
 logger = logging.getLogger(__name__)
@@ -42,45 +47,79 @@ class GeminiClient:
     Robust client for Google Gemini API.
 
     Features:
+    - Async API calls (agenerate_response)
+    - Response cache for repeated deterministic prompts (opt-in: temperature 0)
     - Automatic retry on network errors
     - Proper exception classification
     - Request/response logging
     - Health check functionality
     """
 
-    def __init__(self, config: GeminiConfig):
+    def __init__(self, config: GeminiConfig, cache: Optional[CacheBackend] = None):
         """
         Initialize Gemini client.
 
         Args:
             config: GeminiConfig instance with API settings
+            cache: Response cache (default: Redis if configured, else in-process)
         """
         self.config = config
 
+        if cache is None:
+            if config.cache_redis_url:
+                cache = RedisCache(config.cache_redis_url)
+            else:
+                cache = LRUCache(max_size=config.cache_size)
+        self.cache = cache
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # Last successful health probe, reused for _health_ttl seconds
+        self._last_healthy_at = 0.0
+        self._last_health_length = 0
+        self._health_ttl = 30.0
+
+        # Sampling settings sent with every request (None: model defaults)
+        self._generation_config = (
+            {"temperature": config.temperature} if config.temperature is not None else None
+        )
+
         # Configure the Gemini API
         genai.configure(api_key=config.api_key)
 
+        # One model per distinct system instruction, built on first use
+        self._instruction_models = lru_cache(maxsize=32)(self._build_model)
+
         # Initialize the model
         try:
-            self.model = genai.GenerativeModel(config.model)
-            logger.info(f"✅ Gemini client initialized with model: {config.model}")
+            self.model = genai.GenerativeModel(config.model, generation_config=self._generation_config)
+            logger.info("✅ Gemini client initialized with model: %s", config.model)
         except Exception as e:
-            logger.error(f"❌ Failed to initialize Gemini model: {e}")
+            logger.error("❌ Failed to initialize Gemini model: %s", e)
             raise GeminiError(f"Failed to initialize Gemini model '{config.model}': {str(e)}")
 
-    def generate_response(
+    async def agenerate_response(
         self,
-        prompt: str,
+        prompt: Union[str, List[Dict[str, Any]]],
         system_instruction: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
     ) -> str:
         """
         Generate a response from Gemini API.
 
+        The API call and any retry delay are awaited, so the event loop keeps
+        serving other requests while Gemini responds. Responses are cached
+        only when the client is configured with temperature 0
+        (GEMINI_TEMPERATURE=0); at any other temperature every call reaches
+        the API.
+
         Args:
-            prompt: The user's input prompt
+            prompt: The user's input prompt, or a list of conversation turns
+                ({"role": "user" | "model", "parts": [text]}) ending with it
             system_instruction: Optional system instruction for the model
             context: Optional context dict (may include request_id, user_id, etc.)
+            use_cache: Whether a cacheable response may be served from or stored in the cache
 
         Returns:
             Generated response text
@@ -95,15 +134,33 @@ class GeminiClient:
         request_id = context.get("request_id", "unknown")
 
         # Log the request
-        logger.debug(
-            f"Gemini request started",
-            extra={
-                "request_id": request_id,
-                "prompt_length": len(prompt),
-                "model": self.config.model,
-                "has_system_instruction": system_instruction is not None,
-            }
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            # Characters sent, whether the prompt is text or a list of turns
+            prompt_text = prompt if isinstance(prompt, str) else json.dumps(prompt, ensure_ascii=False)
+            logger.debug(
+                "Gemini request started",
+                extra={
+                    "request_id": request_id,
+                    "prompt_length": len(prompt_text),
+                    "model": self.config.model,
+                    "has_system_instruction": system_instruction is not None,
+                }
+            )
+
+        # Serve repeated deterministic requests without calling the API
+        key = None
+        if use_cache:
+            key = cache_key(self.config.model, system_instruction, prompt, self.config.temperature)
+        if key is not None:
+            cached = await self._cache_get(key)
+            if cached is not None:
+                self.cache_hits += 1
+                logger.info(
+                    "Gemini response served from cache",
+                    extra={"request_id": request_id, "response_length": len(cached)}
+                )
+                return cached
+            self.cache_misses += 1
 
         start_time = time.time()
         attempt = 0
@@ -113,15 +170,8 @@ class GeminiClient:
 
             try:
                 # Generate content
-                if system_instruction:
-                    # Create a new model instance with system instruction
-                    model_with_instruction = genai.GenerativeModel(
-                        self.config.model,
-                        system_instruction=system_instruction
-                    )
-                    response = model_with_instruction.generate_content(prompt)
-                else:
-                    response = self.model.generate_content(prompt)
+                model = self._get_model(system_instruction)
+                response = await model.generate_content_async(prompt)
 
                 # Extract text from response
                 response_text = response.text
@@ -129,22 +179,19 @@ class GeminiClient:
                 # Log success
                 duration = time.time() - start_time
                 logger.info(
-                    f"Gemini response received",
-                    extra={
-                        "request_id": request_id,
-                        "response_length": len(response_text),
-                        "duration": f"{duration:.2f}s",
-                        "model": self.config.model,
-                        "attempt": attempt,
-                    }
+                    "Gemini response received request_id=%s len=%d dur=%.2fs attempt=%d",
+                    request_id, len(response_text), duration, attempt
                 )
 
+                if key is not None:
+                    await self._cache_set(key, response_text)
+
                 return response_text
 
             except google_exceptions.Unauthenticated as e:
                 # Authentication error - don't retry
                 logger.error(
-                    f"Gemini API authentication failed",
+                    "Gemini API authentication failed",
                     extra={
                         "request_id": request_id,
                         "error_type": "authentication",
@@ -153,23 +200,38 @@ class GeminiClient:
                     },
                     exc_info=True
                 )
+                self._last_healthy_at = 0.0
                 raise GeminiAuthError(
                     f"Invalid Gemini API key. Please verify your API key is correct. "
                     f"Get a new key from https://makersuite.google.com/app/apikey"
                 ) from e
 
             except google_exceptions.ResourceExhausted as e:
-                # Quota exceeded - don't retry
-                logger.error(
-                    f"Gemini API quota exceeded",
+                # Rate limited (429) - back off and retry if attempts remain
+                will_retry = attempt < self.config.max_retries
+
+                logger.warning(
+                    "Gemini API quota exceeded (attempt %d/%d)", attempt, self.config.max_retries,
                     extra={
                         "request_id": request_id,
                         "error_type": "quota_exceeded",
                         "attempt": attempt,
-                        "will_retry": False,
-                    },
+                        "will_retry": will_retry,
+                    }
+                )
+
+                if will_retry:
+                    delay = self._backoff_delay(attempt)
+                    logger.debug("Retrying in %.2fs...", delay)
+                    await asyncio.sleep(delay)
+                    continue  # Retry
+
+                logger.error(
+                    "Gemini API quota exceeded - max retries exceeded",
+                    extra={"request_id": request_id},
                     exc_info=True
                 )
+                self._last_healthy_at = 0.0
                 raise GeminiQuotaError(
                     f"Gemini API quota exceeded. Please check your usage limits or try again later."
                 ) from e
@@ -179,7 +241,7 @@ class GeminiClient:
                 will_retry = attempt < self.config.max_retries
 
                 logger.warning(
-                    f"Gemini API network error (attempt {attempt}/{self.config.max_retries})",
+                    "Gemini API network error (attempt %d/%d)", attempt, self.config.max_retries,
                     extra={
                         "request_id": request_id,
                         "error_type": "network",
@@ -190,17 +252,18 @@ class GeminiClient:
 
                 if will_retry:
                     # Wait before retrying
-                    delay = self.config.retry_delay * attempt  # Exponential backoff
-                    logger.debug(f"Retrying in {delay}s...")
-                    time.sleep(delay)
+                    delay = self._backoff_delay(attempt)
+                    logger.debug("Retrying in %.2fs...", delay)
+                    await asyncio.sleep(delay)
                     continue  # Retry
                 else:
                     # Out of retries
                     logger.error(
-                        f"Gemini API network error - max retries exceeded",
+                        "Gemini API network error - max retries exceeded",
                         extra={"request_id": request_id},
                         exc_info=True
                     )
+                    self._last_healthy_at = 0.0
                     raise GeminiNetworkError(
                         f"Network error communicating with Gemini API. "
                         f"The service may be temporarily unavailable. Please try again later."
@@ -209,7 +272,7 @@ class GeminiClient:
             except google_exceptions.NotFound as e:
                 # Model not found - don't retry
                 logger.error(
-                    f"Gemini model not found",
+                    "Gemini model not found",
                     extra={
                         "request_id": request_id,
                         "model": self.config.model,
@@ -226,7 +289,7 @@ class GeminiClient:
             except Exception as e:
                 # Unexpected error - log and raise
                 logger.error(
-                    f"Unexpected Gemini API error",
+                    "Unexpected Gemini API error",
                     extra={
                         "request_id": request_id,
                         "error_type": "unknown",
@@ -242,11 +305,64 @@ class GeminiClient:
         # Should never reach here, but just in case
         raise GeminiNetworkError("Max retries exceeded")
 
-    def health_check(self) -> Dict[str, Any]:
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Seconds to wait before retrying after a failed attempt
+
+        Capped exponential backoff with full jitter, so clients that failed
+        together do not retry together.
+        """
+        ceiling = min(self.config.retry_cap, self.config.retry_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    def _build_model(self, system_instruction: str) -> genai.GenerativeModel:
+        """Create a model instance carrying a system instruction."""
+        return genai.GenerativeModel(
+            self.config.model,
+            generation_config=self._generation_config,
+            system_instruction=system_instruction
+        )
+
+    def _get_model(self, system_instruction: Optional[str]) -> genai.GenerativeModel:
+        """
+        Get the model to use for a system instruction.
+
+        Models are reused across requests, so the same instruction (such as
+        the agent's system prompt) always gets the same instance.
+
+        Args:
+            system_instruction: System instruction, or None for the base model
+
+        Returns:
+            Cached GenerativeModel instance
+        """
+        if not system_instruction:
+            return self.model
+        return self._instruction_models(system_instruction)
+
+    async def _cache_get(self, key: str) -> Optional[str]:
+        """Look up a cached response; a failing cache counts as a miss."""
+        try:
+            return await self.cache.get(key)
+        except Exception:
+            logger.warning("Gemini response cache lookup failed", exc_info=True)
+            return None
+
+    async def _cache_set(self, key: str, response_text: str) -> None:
+        """Cache a response; a failing cache is logged and otherwise ignored."""
+        try:
+            await self.cache.set(key, response_text, ttl=self.config.cache_ttl)
+        except Exception:
+            logger.warning("Gemini response cache store failed", exc_info=True)
+
+    async def ahealth_check(self) -> Dict[str, Any]:
         """
         Check Gemini API health.
 
-        Sends a trivial prompt to verify API connectivity.
+        Sends a trivial prompt to verify API connectivity. A successful
+        probe is reused for the next 30 seconds without calling the API,
+        unless a request fails with an auth, quota or network error meanwhile.
+        Any failed probe clears the cached result.
 
         Returns:
             Dict with health status:
@@ -256,22 +372,38 @@ class GeminiClient:
                 "model": str,
                 "timestamp": float,
                 "response_length": int,  # if healthy
+                "cache": {"hits": int, "misses": int},  # if healthy
+                "cached": bool,  # if healthy; True when no probe was sent
                 "error": str,  # if unhealthy
                 "message": str,  # if unhealthy
             }
         """
         timestamp = time.time()
 
+        if time.monotonic() - self._last_healthy_at < self._health_ttl:
+            return {
+                "service": "gemini",
+                "status": "healthy",
+                "model": self.config.model,
+                "timestamp": timestamp,
+                "response_length": self._last_health_length,
+                "cache": {"hits": self.cache_hits, "misses": self.cache_misses},
+                "cached": True,
+            }
+
         logger.info("Running Gemini health check...")
 
         try:
             # Send trivial prompt
-            response = self.generate_response(
+            response = await self.agenerate_response(
                 prompt="Hello from SalaatFlow health check. Respond with 'OK'.",
-                context={"request_id": "health-check"}
+                context={"request_id": "health-check"},
+                use_cache=False,  # A cached reply would not show the API is reachable
             )
 
             logger.info("✅ Gemini health check passed")
+            self._last_healthy_at = time.monotonic()
+            self._last_health_length = len(response)
 
             return {
                 "service": "gemini",
@@ -279,10 +411,13 @@ class GeminiClient:
                 "model": self.config.model,
                 "timestamp": timestamp,
                 "response_length": len(response),
+                "cache": {"hits": self.cache_hits, "misses": self.cache_misses},
+                "cached": False,
             }
 
         except GeminiAuthError as e:
-            logger.error(f"❌ Gemini health check failed: authentication error")
+            self._last_healthy_at = 0.0
+            logger.error("❌ Gemini health check failed: authentication error")
             return {
                 "service": "gemini",
                 "status": "unhealthy",
@@ -292,7 +427,8 @@ class GeminiClient:
             }
 
         except GeminiQuotaError as e:
-            logger.error(f"❌ Gemini health check failed: quota exceeded")
+            self._last_healthy_at = 0.0
+            logger.error("❌ Gemini health check failed: quota exceeded")
             return {
                 "service": "gemini",
                 "status": "unhealthy",
@@ -302,7 +438,8 @@ class GeminiClient:
             }
 
         except GeminiNetworkError as e:
-            logger.error(f"❌ Gemini health check failed: network error")
+            self._last_healthy_at = 0.0
+            logger.error("❌ Gemini health check failed: network error")
             return {
                 "service": "gemini",
                 "status": "unhealthy",
@@ -312,7 +449,8 @@ class GeminiClient:
             }
 
         except GeminiError as e:
-            logger.error(f"❌ Gemini health check failed: {e}")
+            self._last_healthy_at = 0.0
+            logger.error("❌ Gemini health check failed: %s", e)
             return {
                 "service": "gemini",
                 "status": "unhealthy",
@@ -322,7 +460,8 @@ class GeminiClient:
             }
 
         except Exception as e:
-            logger.error(f"❌ Gemini health check failed: unexpected error", exc_info=True)
+            self._last_healthy_at = 0.0
+            logger.error("❌ Gemini health check failed: unexpected error", exc_info=True)
             return {
                 "service": "gemini",
                 "status": "unhealthy",
@@ -351,28 +490,32 @@ if __name__ == "__main__":
         client = GeminiClient(config)
         print(f"✅ Client initialized")
 
-        # Health check
-        print("\n📊 Running health check...")
-        health = client.health_check()
-
-        if health["status"] == "healthy":
-            print(f"✅ Health check PASSED")
-            print(f"   Model: {health['model']}")
-            print(f"   Response length: {health['response_length']} chars")
-        else:
-            print(f"❌ Health check FAILED")
-            print(f"   Error: {health.get('error')}")
-            print(f"   Message: {health.get('message')}")
-            sys.exit(1)
-
-        # Test simple generation
-        print("\n💬 Testing simple generation...")
-        response = client.generate_response(
-            "Say 'Hello from SalaatFlow!' in one sentence.",
-            context={"request_id": "test-001"}
-        )
-        print(f"✅ Response received:")
-        print(f"   {response[:100]}...")
+        async def run_checks():
+            """Run both checks on one event loop, which the async gRPC channel is bound to."""
+            # Health check
+            print("\n📊 Running health check...")
+            health = await client.ahealth_check()
+
+            if health["status"] == "healthy":
+                print(f"✅ Health check PASSED")
+                print(f"   Model: {health['model']}")
+                print(f"   Response length: {health['response_length']} chars")
+            else:
+                print(f"❌ Health check FAILED")
+                print(f"   Error: {health.get('error')}")
+                print(f"   Message: {health.get('message')}")
+                sys.exit(1)
+
+            # Test simple generation
+            print("\n💬 Testing simple generation...")
+            response = await client.agenerate_response(
+                "Say 'Hello from SalaatFlow!' in one sentence.",
+                context={"request_id": "test-001"}
+            )
+            print(f"✅ Response received:")
+            print(f"   {response[:100]}...")
+
+        asyncio.run(run_checks())
 
         print("\n" + "=" * 60)
         print("✅ All tests passed!")
@@ -5,9 +5,20 @@ Provides validated configuration for Google Gemini API integration.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic import BaseModel, Field, field_validator
 
+from chatbot.config.settings import get_settings
+
+# Example values from docs and .env templates that are not real keys
+_PLACEHOLDERS = frozenset({
+    "your-gemini-api-key",
+    "your-api-key-here",
+    "placeholder",
+    "xxx",
+})
+
 
 class GeminiConfig(BaseModel):
     """
@@ -20,7 +31,12 @@ class GeminiConfig(BaseModel):
     model: str = Field(default="gemini-2.0-flash", description="Gemini model name")
     timeout: int = Field(default=30, description="Request timeout in seconds")
     max_retries: int = Field(default=2, description="Maximum retry attempts")
-    retry_delay: float = Field(default=1.0, description="Delay between retries in seconds")
+    retry_delay: float = Field(default=1.0, description="Base delay between retries in seconds")
+    retry_cap: float = Field(default=30.0, description="Maximum delay between retries in seconds")
+    temperature: Optional[float] = Field(default=None, description="Sampling temperature (None: model default)")
+    cache_ttl: float = Field(default=3600.0, description="Seconds a cached response is served")
+    cache_size: int = Field(default=512, description="Responses kept by the in-process cache")
+    cache_redis_url: Optional[str] = Field(default=None, description="Redis URL for a shared response cache")
 
     @field_validator('api_key')
     @classmethod
@@ -30,13 +46,7 @@ class GeminiConfig(BaseModel):
             raise ValueError("GEMINI_API_KEY cannot be empty")
 
         # Check for placeholder values
-        placeholder_values = [
-            "your-gemini-api-key",
-            "your-api-key-here",
-            "placeholder",
-            "xxx",
-        ]
-        if v.lower() in placeholder_values:
+        if v.lower() in _PLACEHOLDERS:
             raise ValueError(
                 f"Invalid Gemini API key: '{v}' appears to be a placeholder. "
                 "Please set a real API key from https://makersuite.google.com/app/apikey"
@@ -59,6 +69,14 @@ class GeminiConfig(BaseModel):
 
         return v
 
+    @field_validator('temperature')
+    @classmethod
+    def validate_temperature(cls, v: Optional[float]) -> Optional[float]:
+        """Validate temperature is within Gemini's range."""
+        if v is not None and not 0.0 <= v <= 2.0:
+            raise ValueError(f"Temperature must be between 0.0 and 2.0, got {v}")
+        return v
+
     @field_validator('timeout')
     @classmethod
     def validate_timeout(cls, v: int) -> int:
@@ -83,6 +101,14 @@ class GeminiConfig(BaseModel):
             raise ValueError(f"Retry delay must be between 0.1 and 10.0 seconds, got {v}")
         return v
 
+    @field_validator('retry_cap')
+    @classmethod
+    def validate_retry_cap(cls, v: float) -> float:
+        """Validate retry_cap is reasonable."""
+        if not 0.1 <= v <= 120.0:
+            raise ValueError(f"Retry cap must be between 0.1 and 120.0 seconds, got {v}")
+        return v
+
     @classmethod
     def from_env(cls) -> "GeminiConfig":
         """
@@ -94,6 +120,11 @@ class GeminiConfig(BaseModel):
         - GEMINI_TIMEOUT (optional, default: 30)
         - GEMINI_MAX_RETRIES (optional, default: 2)
         - GEMINI_RETRY_DELAY (optional, default: 1.0)
+        - GEMINI_RETRY_CAP (optional, default: 30.0)
+        - GEMINI_TEMPERATURE (optional, default: model default; 0 enables caching)
+        - GEMINI_CACHE_TTL (optional, default: 3600)
+        - GEMINI_CACHE_SIZE (optional, default: 512)
+        - GEMINI_CACHE_REDIS_URL (optional, default: in-process cache)
 
         Returns:
             GeminiConfig instance
@@ -110,12 +141,19 @@ class GeminiConfig(BaseModel):
                 "https://makersuite.google.com/app/apikey"
             )
 
+        temperature = os.getenv("GEMINI_TEMPERATURE")
+
         return cls(
             api_key=api_key,
             model=os.getenv("GEMINI_MODEL", "gemini-2.0-flash"),
             timeout=int(os.getenv("GEMINI_TIMEOUT", "30")),
             max_retries=int(os.getenv("GEMINI_MAX_RETRIES", "2")),
             retry_delay=float(os.getenv("GEMINI_RETRY_DELAY", "1.0")),
+            retry_cap=float(os.getenv("GEMINI_RETRY_CAP", "30.0")),
+            temperature=float(temperature) if temperature else None,
+            cache_ttl=float(os.getenv("GEMINI_CACHE_TTL", "3600")),
+            cache_size=int(os.getenv("GEMINI_CACHE_SIZE", "512")),
+            cache_redis_url=os.getenv("GEMINI_CACHE_REDIS_URL") or None,
         )
 
     class Config:
@@ -123,16 +161,15 @@ class GeminiConfig(BaseModel):
         frozen = True  # Make config immutable
 
 
-# Singleton instance - loaded once at module import
-_config: Optional[GeminiConfig] = None
-
-
+@lru_cache(maxsize=1)
 def get_gemini_config() -> GeminiConfig:
     """
     Get the global Gemini configuration instance.
 
-    Loads configuration from environment on first call,
-    then returns cached instance.
+    Loads and validates configuration from environment on first call,
+    then returns the cached instance. A failed load is not cached.
+    Chatbot settings are loaded first, so a key kept only in backend/.env
+    is in the environment before it is read.
 
     Returns:
         GeminiConfig instance
@@ -140,19 +177,14 @@ def get_gemini_config() -> GeminiConfig:
     Raises:
         ValueError: If configuration is invalid
     """
-    global _config
-
-    if _config is None:
-        _config = GeminiConfig.from_env()
-
-    return _config
+    get_settings()
+    return GeminiConfig.from_env()
 
 
 # For testing - reset the singleton
 def reset_config():
     """Reset the configuration singleton (for testing only)."""
-    global _config
-    _config = None
+    get_gemini_config.cache_clear()
 
 
 if __name__ == "__main__":
@@ -170,6 +202,7 @@ if __name__ == "__main__":
         print(f"⏱️  Timeout: {config.timeout}s")
         print(f"🔄 Max Retries: {config.max_retries}")
         print(f"⏳ Retry Delay: {config.retry_delay}s")
+        print(f"⏳ Retry Cap: {config.retry_cap}s")
         print(f"🔑 API Key: {config.api_key[:10]}...{config.api_key[-5:]}")
 
         print("\n" + "=" * 60)
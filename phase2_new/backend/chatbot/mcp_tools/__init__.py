@@ -9,6 +9,7 @@ from chatbot.mcp_tools.registry import (
     ToolRegistry,
     get_tool_registry,
     execute_tool,
+    aexecute_tool,
     validate_all_tools,
 )
 
@@ -33,6 +34,7 @@ __all__ = [
     "ToolRegistry",
     "get_tool_registry",
     "execute_tool",
+    "aexecute_tool",
     "validate_all_tools",
     # Tool name constants
     "ALL_TOOL_NAMES",
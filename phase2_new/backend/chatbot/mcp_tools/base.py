@@ -3,14 +3,103 @@ Base MCP Tool Class
 Wraps Phase II backend APIs for use by AI agent
 """
 
+import asyncio
+import os
+import re
 import requests
+import httpx
 import logging
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Tuple
 from pydantic import BaseModel
-from chatbot.config.settings import BACKEND_BASE_URL
+from requests.adapters import HTTPAdapter
+from chatbot.config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# One pooled session shared by all tools, so successive backend calls reuse
+# kept-alive connections instead of opening (and TLS-handshaking) a new one
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# Async counterpart for aexecute, created on first use inside the event loop
+_ACLIENT: Optional[httpx.AsyncClient] = None
+
+# Caps backend calls in flight at once, so bursts queue here rather than
+# overflowing the connection pool
+_BACKEND_SLOTS = asyncio.Semaphore(int(os.getenv("MCP_MAX_CONCURRENCY", "16")))
+
+# Retries after a 429 from the backend, and the longest wait honoured
+_RATE_LIMIT_RETRIES = 2
+_MAX_RATE_LIMIT_WAIT = 5.0
+
+
+# Supported HTTP methods; those listed here send parameters as a JSON body,
+# the rest as query parameters
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+_SUPPORTED_METHODS = _BODY_METHODS | {"GET", "DELETE"}
+
+# Headers sent with every backend call
+_HEADERS = {"Content-Type": "application/json"}
+
+# Path parameters in a backend path template, e.g. {task_id}
+_PATH_PARAM = re.compile(r"\{(\w+)\}")
+
+
+class _PathValues(dict):
+    """Path parameter values; a parameter with no value keeps its {placeholder}"""
+
+    def __missing__(self, key: str) -> str:
+        return f"{{{key}}}"
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client (HTTP/2 where the backend offers it)
+
+    Returns:
+        httpx.AsyncClient instance
+    """
+    global _ACLIENT
+
+    if _ACLIENT is None:
+        _ACLIENT = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=10.0,
+        )
+
+    return _ACLIENT
+
+
+async def close_async_client() -> None:
+    """Close the shared async HTTP client (call on application shutdown)"""
+    global _ACLIENT
+
+    if _ACLIENT is not None:
+        await _ACLIENT.aclose()
+        _ACLIENT = None
+
+
+def _rate_limit_delay(response: httpx.Response, attempt: int) -> float:
+    """
+    Seconds to wait before retrying a 429 response
+
+    Args:
+        response: The 429 response
+        attempt: Retry number, starting at 0
+
+    Returns:
+        The server's Retry-After (in seconds) if given, else an exponential
+        backoff; capped at _MAX_RATE_LIMIT_WAIT
+    """
+    try:
+        delay = float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        delay = 0.5 * (2 ** attempt)
+    return min(max(delay, 0.0), _MAX_RATE_LIMIT_WAIT)
+
 
 class ToolResult(BaseModel):
     """Standard result format for all MCP tools"""
@@ -53,10 +142,87 @@ class MCPTool:
         self.input_schema = input_schema
         self.backend_config = backend_config
 
+        # Parse the path template once; calls then substitute in a single pass
+        self._path_template = backend_config['path']
+        self._path_params = frozenset(_PATH_PARAM.findall(self._path_template))
+
+        # Resolve the HTTP method once: its session function, and whether
+        # parameters go in the body (None marks an unsupported method)
+        self._method = backend_config['method'].upper()
+        self._use_json = self._method in _BODY_METHODS
+        self._http_fn = (
+            getattr(_SESSION, self._method.lower()) if self._method in _SUPPORTED_METHODS else None
+        )
+
+    def _prepare(self, user_id: int, kwargs: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Build the request method and URL, adding user_id to the parameters
+
+        Path parameters (e.g., {task_id}) are substituted into the URL and
+        removed from kwargs, so they aren't also sent as query or body fields.
+
+        Args:
+            user_id: User ID for the request
+            kwargs: Tool-specific parameters (updated in place)
+
+        Returns:
+            Tuple of (uppercase HTTP method, URL)
+        """
+        # Build URL
+        path = self._path_template
+        if self._path_params:
+            path = path.format_map(_PathValues(
+                (key, kwargs.pop(key)) for key in self._path_params if key in kwargs
+            ))
+        url = f"{get_settings().backend_base_url}{path}"
+
+        method = self._method
+
+        # Add user_id to kwargs if not already present
+        if 'user_id' not in kwargs:
+            kwargs['user_id'] = user_id
+
+        # Log the request
+        logger.info("MCP Tool [%s]: %s %s", self.name, method, url)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Parameters: %s", kwargs)
+
+        return method, url
+
+    def _handle_response(self, response) -> Dict[str, Any]:
+        """
+        Convert a backend response into the tool result
+
+        Args:
+            response: requests or httpx response (both expose the same fields)
+
+        Returns:
+            API response dict or error dict
+        """
+        if response.status_code in [200, 201]:
+            result = response.json() if response.content else {"success": True}
+            logger.info("MCP Tool [%s]: Success", self.name)
+            return result
+        elif response.status_code == 204:
+            # No content (successful DELETE)
+            logger.info("MCP Tool [%s]: Success (no content)", self.name)
+            return {"success": True, "message": "Operation completed successfully"}
+        elif response.status_code == 404:
+            logger.warning("MCP Tool [%s]: Resource not found", self.name)
+            return {"error": "NOT_FOUND", "message": "Resource not found"}
+        elif response.status_code >= 500:
+            logger.error("MCP Tool [%s]: Backend error %s", self.name, response.status_code)
+            return {"error": "BACKEND_ERROR", "message": "Backend service error"}
+        else:
+            logger.error("MCP Tool [%s]: Error %s", self.name, response.status_code)
+            return {"error": "UNKNOWN_ERROR", "message": f"HTTP {response.status_code}: {response.text[:100]}"}
+
     def execute(self, user_id: int, **kwargs) -> Dict[str, Any]:
         """
         Execute the tool by calling Phase II backend API
 
+        Blocks until the backend responds; async code should await aexecute.
+
         Args:
             user_id: User ID for the request
             **kwargs: Tool-specific parameters
@@ -65,69 +231,76 @@ class MCPTool:
             API response dict or error dict
         """
         try:
-            # Build URL
-            url = f"{BACKEND_BASE_URL}{self.backend_config['path']}"
-
-            # Replace path parameters (e.g., {task_id})
-            for key, value in kwargs.items():
-                placeholder = f"{{{key}}}"
-                if placeholder in url:
-                    url = url.replace(placeholder, str(value))
-
-            # Prepare request
-            method = self.backend_config['method'].upper()
-            headers = {"Content-Type": "application/json"}
-
-            # Add user_id to kwargs if not already present
-            if 'user_id' not in kwargs:
-                kwargs['user_id'] = user_id
-
-            # Log the request
-            logger.info(f"MCP Tool [{self.name}]: {method} {url}")
-            logger.debug(f"Parameters: {kwargs}")
-
-            # Make HTTP request
-            if method == "GET":
-                # For GET, use query parameters
-                response = requests.get(url, params=kwargs, headers=headers, timeout=10)
-            elif method == "POST":
-                response = requests.post(url, json=kwargs, headers=headers, timeout=10)
-            elif method == "PUT":
-                response = requests.put(url, json=kwargs, headers=headers, timeout=10)
-            elif method == "PATCH":
-                response = requests.patch(url, json=kwargs, headers=headers, timeout=10)
-            elif method == "DELETE":
-                response = requests.delete(url, params=kwargs, headers=headers, timeout=10)
-            else:
+            method, url = self._prepare(user_id, kwargs)
+
+            if self._http_fn is None:
                 return {"error": "INVALID_METHOD", "message": f"Unsupported HTTP method: {method}"}
 
-            # Handle response
-            if response.status_code in [200, 201]:
-                result = response.json() if response.content else {"success": True}
-                logger.info(f"MCP Tool [{self.name}]: Success")
-                return result
-            elif response.status_code == 204:
-                # No content (successful DELETE)
-                logger.info(f"MCP Tool [{self.name}]: Success (no content)")
-                return {"success": True, "message": "Operation completed successfully"}
-            elif response.status_code == 404:
-                logger.warning(f"MCP Tool [{self.name}]: Resource not found")
-                return {"error": "NOT_FOUND", "message": "Resource not found"}
-            elif response.status_code >= 500:
-                logger.error(f"MCP Tool [{self.name}]: Backend error {response.status_code}")
-                return {"error": "BACKEND_ERROR", "message": "Backend service error"}
-            else:
-                logger.error(f"MCP Tool [{self.name}]: Error {response.status_code}")
-                return {"error": "UNKNOWN_ERROR", "message": f"HTTP {response.status_code}: {response.text[:100]}"}
+            # Make HTTP request (GET/DELETE send query parameters, others a JSON body)
+            response = self._http_fn(
+                url,
+                json=kwargs if self._use_json else None,
+                params=None if self._use_json else kwargs,
+                headers=_HEADERS,
+                timeout=self.backend_config.get('timeout', 10)
+            )
+
+            return self._handle_response(response)
 
         except requests.exceptions.Timeout:
-            logger.error(f"MCP Tool [{self.name}]: Timeout")
+            logger.error("MCP Tool [%s]: Timeout", self.name)
             return {"error": "TIMEOUT", "message": "Request timed out"}
         except requests.exceptions.ConnectionError as e:
-            logger.error(f"MCP Tool [{self.name}]: Connection error: {e}")
+            logger.error("MCP Tool [%s]: Connection error: %s", self.name, e)
+            return {"error": "CONNECTION_ERROR", "message": f"Could not connect to backend: {str(e)}"}
+        except Exception as e:
+            logger.error("MCP Tool [%s]: Unexpected error: %s", self.name, e, exc_info=True)
+            return {"error": "EXECUTION_ERROR", "message": f"Tool execution failed: {str(e)}"}
+
+    async def aexecute(self, user_id: int, **kwargs) -> Dict[str, Any]:
+        """
+        Execute the tool by calling Phase II backend API, without blocking
+
+        Concurrent calls share one connection pool and at most
+        MCP_MAX_CONCURRENCY (default 16) are in flight; a 429 from the
+        backend is retried after its Retry-After delay.
+
+        Args:
+            user_id: User ID for the request
+            **kwargs: Tool-specific parameters
+
+        Returns:
+            API response dict or error dict
+        """
+        try:
+            method, url = self._prepare(user_id, kwargs)
+
+            if self._http_fn is None:
+                return {"error": "INVALID_METHOD", "message": f"Unsupported HTTP method: {method}"}
+
+            payload = {"json": kwargs} if self._use_json else {"params": kwargs}
+            client = _get_async_client()
+            timeout = self.backend_config.get('timeout', 10)
+
+            async with _BACKEND_SLOTS:
+                for attempt in range(_RATE_LIMIT_RETRIES + 1):
+                    response = await client.request(method, url, headers=_HEADERS, timeout=timeout, **payload)
+                    if response.status_code != 429 or attempt == _RATE_LIMIT_RETRIES:
+                        break
+                    delay = _rate_limit_delay(response, attempt)
+                    logger.warning("MCP Tool [%s]: Rate limited, retrying in %.1fs", self.name, delay)
+                    await asyncio.sleep(delay)
+
+            return self._handle_response(response)
+
+        except httpx.TimeoutException:
+            logger.error("MCP Tool [%s]: Timeout", self.name)
+            return {"error": "TIMEOUT", "message": "Request timed out"}
+        except httpx.TransportError as e:
+            logger.error("MCP Tool [%s]: Connection error: %s", self.name, e)
             return {"error": "CONNECTION_ERROR", "message": f"Could not connect to backend: {str(e)}"}
         except Exception as e:
-            logger.error(f"MCP Tool [{self.name}]: Unexpected error: {e}", exc_info=True)
+            logger.error("MCP Tool [%s]: Unexpected error: %s", self.name, e, exc_info=True)
             return {"error": "EXECUTION_ERROR", "message": f"Tool execution failed: {str(e)}"}
 
     def to_openai_tool_schema(self) -> Dict:
@@ -186,8 +359,9 @@ class CallableTool:
             ToolResult as dict
         """
         try:
-            logger.info(f"CallableTool [{self.name}]: Executing for user {user_id}")
-            logger.debug(f"Parameters: {kwargs}")
+            logger.info("CallableTool [%s]: Executing for user %s", self.name, user_id)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Parameters: %s", kwargs)
 
             # Call the function directly (bypasses HTTP)
             result = self.callable_func(user_id=user_id, **kwargs)
@@ -198,11 +372,11 @@ class CallableTool:
             else:
                 result_dict = result
 
-            logger.info(f"CallableTool [{self.name}]: {'Success' if result_dict.get('success') else 'Failed'}")
+            logger.info("CallableTool [%s]: %s", self.name, "Success" if result_dict.get("success") else "Failed")
             return result_dict
 
         except Exception as e:
-            logger.error(f"CallableTool [{self.name}]: Unexpected error: {e}", exc_info=True)
+            logger.error("CallableTool [%s]: Unexpected error: %s", self.name, e, exc_info=True)
             return {
                 "success": False,
                 "error": "EXECUTION_ERROR",
@@ -6,6 +6,7 @@ CRITICAL: This registry MUST contain all 12 tools defined in constants.py.
 Application startup MUST fail if any tool is missing.
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional
 
@@ -56,9 +57,9 @@ class ToolRegistry:
                 )
 
             self._tools[tool.name] = tool
-            logger.debug(f"Registered tool: {tool.name} (category: {get_tool_category(tool.name)})")
+            logger.debug("Registered tool: %s (category: %s)", tool.name, get_tool_category(tool.name))
 
-        logger.info(f"✅ Tool registry initialized with {len(self._tools)} tools")
+        logger.info("✅ Tool registry initialized with %d tools", len(self._tools))
 
     def has(self, tool_name: str) -> bool:
         """
@@ -110,13 +111,44 @@ class ToolRegistry:
             }
 
         tool = self._tools[tool_name]
-        logger.info(f"Executing tool: {tool_name} for user {user_id}")
+        logger.info("Executing tool: %s for user %s", tool_name, user_id)
 
         try:
             result = tool.execute(user_id, **kwargs)
             return result
         except Exception as e:
-            logger.error(f"Tool execution error: {tool_name} - {e}", exc_info=True)
+            logger.error("Tool execution error: %s - %s", tool_name, e, exc_info=True)
+            return {
+                "success": False,
+                "error": "TOOL_EXECUTION_ERROR",
+                "error_message": f"Failed to execute tool '{tool_name}': {str(e)}"
+            }
+
+    async def aexecute(self, tool_name: str, user_id: int, **kwargs) -> Dict[str, Any]:
+        """
+        Execute a tool by name without blocking the event loop
+
+        Tools with an async implementation are awaited; blocking ones (direct
+        database calls) run in a worker thread.
+
+        Args:
+            tool_name: Name of the tool to execute
+            user_id: User ID for the request
+            **kwargs: Tool-specific parameters
+
+        Returns:
+            Tool execution result
+        """
+        tool = self._tools.get(tool_name)
+        if tool is None or not hasattr(tool, "aexecute"):
+            return await asyncio.to_thread(self.execute, tool_name, user_id, **kwargs)
+
+        logger.info("Executing tool: %s for user %s", tool_name, user_id)
+
+        try:
+            return await tool.aexecute(user_id, **kwargs)
+        except Exception as e:
+            logger.error("Tool execution error: %s - %s", tool_name, e, exc_info=True)
             return {
                 "success": False,
                 "error": "TOOL_EXECUTION_ERROR",
@@ -154,17 +186,17 @@ class ToolRegistry:
         missing = self.get_missing_tools()
 
         if missing:
-            logger.error(f"❌ Missing tools in registry: {missing}")
+            logger.error("❌ Missing tools in registry: %s", missing)
             return False
 
         if len(self._tools) != len(ALL_TOOL_NAMES):
             logger.warning(
-                f"⚠️ Tool count mismatch: "
-                f"expected {len(ALL_TOOL_NAMES)}, got {len(self._tools)}"
+                "⚠️ Tool count mismatch: expected %d, got %d",
+                len(ALL_TOOL_NAMES), len(self._tools)
             )
             return False
 
-        logger.info(f"✅ Tool registry validation passed: all {len(ALL_TOOL_NAMES)} tools registered")
+        logger.info("✅ Tool registry validation passed: all %d tools registered", len(ALL_TOOL_NAMES))
         return True
 
     def get_tools_by_category(self, category: str) -> List[str]:
@@ -219,6 +251,22 @@ def execute_tool(tool_name: str, user_id: int, **kwargs) -> Dict[str, Any]:
     return registry.execute(tool_name, user_id, **kwargs)
 
 
+async def aexecute_tool(tool_name: str, user_id: int, **kwargs) -> Dict[str, Any]:
+    """
+    Execute a tool by name using the global registry, without blocking
+
+    Args:
+        tool_name: Name of the tool to execute
+        user_id: User ID for the request
+        **kwargs: Tool-specific parameters
+
+    Returns:
+        Tool execution result
+    """
+    registry = get_tool_registry()
+    return await registry.aexecute(tool_name, user_id, **kwargs)
+
+
 def validate_all_tools() -> bool:
     """
     Validate that all required tools are registered in the global registry
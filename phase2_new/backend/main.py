@@ -12,7 +12,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
 # Configure logging FIRST before any other imports
-from chatbot.config.logging_config import setup_logging, get_logger
+from chatbot.config.logging_config import setup_logging, get_logger, stop_logging
 setup_logging(log_level="INFO")
 
 from config import settings
@@ -50,6 +50,9 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("👋 Shutting down SalaatFlow API...")
+    from chatbot.mcp_tools.base import close_async_client
+    await close_async_client()
+    stop_logging()
 
 
 app = FastAPI(
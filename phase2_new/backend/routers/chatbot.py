@@ -12,7 +12,7 @@ import uuid
 
 from chatbot.gemini.client import GeminiClient, GeminiAuthError, GeminiQuotaError, GeminiNetworkError, GeminiError
 from chatbot.gemini.config import get_gemini_config
-from chatbot.agent.agent import initialize_agent, run_agent
+from chatbot.agent.agent import run_agent
 from chatbot.utils.language import detect_language
 
 router = APIRouter()
@@ -192,7 +192,7 @@ async def chat(chat_request: ChatRequest, request: Request):
 
         # Process message with agent (which uses Gemini client)
         # The agent will use our gemini_client for AI responses
-        response_text = run_agent(
+        response_text = await run_agent(
             agent=None,  # Agent will initialize itself
             user_id=chat_request.user_id or 0,
             user_message=chat_request.message,
@@ -402,7 +402,7 @@ async def health_check():
             }
 
         # Run health check
-        health = gemini_client.health_check()
+        health = await gemini_client.ahealth_check()
 
         if health["status"] == "healthy":
             return health
@@ -0,0 +1 @@
+# SalaatFlow Phase III - Chatbot Tests
@@ -0,0 +1,11 @@
+"""
+Shared test setup
+
+Importing the chatbot pulls in the backend database settings, which need
+these variables; real values from the environment take precedence.
+"""
+
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("GEMINI_API_KEY", "AIza" + "0" * 35)
@@ -0,0 +1,65 @@
+"""
+Tests for chatbot intent detection and task parameter extraction
+
+Expected values are what the original per-alternative regex scan
+returned, so the precompiled classifier must agree with it exactly.
+"""
+
+import pytest
+
+from chatbot.agent.agent import detect_intent, extract_task_params
+
+
+@pytest.mark.parametrize(
+    "message, intent",
+    [
+        ("show my tasks", "list_tasks"),
+        ("Fajr ka task bana do", "create_task"),
+        ("task create karo for reading quran", "create_task"),
+        ("create a new task for isha", "create_task"),
+        ("urgent task hai", "update_task"),
+        ("urgent task bana", "create_task"),
+        ("complete my task", "update_task"),
+        ("delete task 3", "delete_task"),
+        ("remove the task", "delete_task"),
+        ("konse task hain", "list_tasks"),
+        ("mery task dikhao", "list_tasks"),
+        ("konsi masjid nearby", "search_masjids"),
+        ("masjid in DHA area", "search_masjids"),
+        ("namaz kahan parhun Clifton", "search_masjids"),
+        ("Assalamu alaikum", "conversation"),
+        ("what is the hadith today", "conversation"),
+        ("namaz ka task", "create_task"),
+        ("Task CREATE for Maghrib important", "create_task"),
+        ("display everything task", "list_tasks"),
+        ("edit task", "conversation"),
+        ("TASK UPDATE please", "update_task"),
+        ("cancel my task", "delete_task"),
+        ("finish the task at 10:45", "update_task"),
+        ("masjid near me", "conversation"),
+        ("", "conversation"),
+        ("asr done", "conversation"),
+    ],
+)
+def test_detect_intent(message, intent):
+    assert detect_intent(message)["intent"] == intent
+
+
+def test_detect_intent_accepts_precomputed_lowercase():
+    message = "Task CREATE for Maghrib important"
+    assert detect_intent(message, message.lower()) == detect_intent(message)
+
+
+@pytest.mark.parametrize(
+    "message, params",
+    [
+        ("Fajr ka task bana do", {"linked_prayer": "Fajr", "priority": "medium", "title": "Fajr"}),
+        ("add quran task zaruri at 5:30",
+         {"priority": "high", "time": "5:30", "title": "quran zaruri at 5:30"}),
+        ("kam wala task add", {"priority": "low", "title": "kam wala"}),
+        ("fajrabad task bana", {"priority": "medium", "title": "fajrabad"}),
+        ("bana  do   task   dhuhr", {"linked_prayer": "Dhuhr", "priority": "medium", "title": "dhuhr"}),
+    ],
+)
+def test_extract_create_task_params(message, params):
+    assert extract_task_params(message, "create_task") == params
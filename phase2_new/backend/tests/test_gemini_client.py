@@ -0,0 +1,145 @@
+"""
+Tests for the Gemini client response cache and health check
+"""
+
+import asyncio
+import json
+import logging
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from chatbot.gemini.client import GeminiClient
+from chatbot.gemini.config import GeminiConfig
+
+
+class FakeModel:
+    """Stands in for genai.GenerativeModel; each call takes the next queued outcome"""
+
+    def __init__(self):
+        self.calls = 0
+        self.outcomes = []
+
+    async def generate_content_async(self, prompt):
+        self.calls += 1
+        outcome = self.outcomes.pop(0) if self.outcomes else None
+        if isinstance(outcome, asyncio.Event):
+            # Held until the test releases it, then fails
+            await outcome.wait()
+            outcome = self.outcomes.pop(0)
+        if outcome is not None:
+            raise outcome
+
+        class Response:
+            text = "OK"
+
+        return Response()
+
+
+def make_client(**config):
+    client = GeminiClient(GeminiConfig(api_key="AIza" + "0" * 35, max_retries=0, **config))
+    model = FakeModel()
+    client._get_model = lambda system_instruction: model
+    return client, model
+
+
+@pytest.fixture
+def client_and_model():
+    return make_client()
+
+
+def test_responses_are_not_cached_at_the_default_temperature(client_and_model):
+    client, model = client_and_model
+
+    async def scenario():
+        return [await client.agenerate_response("same prompt") for _ in range(2)]
+
+    asyncio.run(scenario())
+    assert model.calls == 2
+    assert (client.cache_hits, client.cache_misses) == (0, 0)
+
+
+def test_temperature_zero_opts_into_the_response_cache():
+    client, model = make_client(temperature=0.0)
+
+    async def scenario():
+        return [await client.agenerate_response("same prompt") for _ in range(2)]
+
+    assert asyncio.run(scenario()) == ["OK", "OK"]
+    assert model.calls == 1
+    assert (client.cache_hits, client.cache_misses) == (1, 1)
+
+
+def test_health_probe_bypasses_the_response_cache():
+    client, model = make_client(temperature=0.0)
+
+    async def scenario():
+        await client.ahealth_check()
+        client._last_healthy_at -= client._health_ttl
+        return await client.ahealth_check()
+
+    health = asyncio.run(scenario())
+    assert health["cached"] is False
+    assert model.calls == 2
+    assert client.cache_hits == 0
+
+
+def test_debug_log_reports_prompt_characters_for_turn_lists(client_and_model, caplog):
+    client, _ = client_and_model
+    turns = [
+        {"role": "user", "parts": ["assalamu alaikum"]},
+        {"role": "model", "parts": ["wa alaikum assalam"]},
+        {"role": "user", "parts": ["what is the hadith today?"]},
+    ]
+
+    with caplog.at_level(logging.DEBUG, logger="chatbot.gemini.client"):
+        asyncio.run(client.agenerate_response(turns))
+
+    started = next(r for r in caplog.records if r.getMessage() == "Gemini request started")
+    assert started.prompt_length == len(json.dumps(turns, ensure_ascii=False))
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (google_exceptions.Unauthenticated("bad key"), "authentication_failed"),
+        (google_exceptions.ResourceExhausted("429"), "quota_exceeded"),
+        (google_exceptions.ServiceUnavailable("503"), "network_error"),
+        (google_exceptions.NotFound("no model"), "gemini_error"),
+    ],
+)
+def test_failed_probe_clears_cached_health(client_and_model, error, expected):
+    client, model = client_and_model
+
+    async def scenario():
+        # The slow probe fails after a concurrent one has succeeded
+        release = asyncio.Event()
+        model.outcomes = [release, None, error]
+        slow_probe = asyncio.create_task(client.ahealth_check())
+        await asyncio.sleep(0)
+        passed = await client.ahealth_check()
+        release.set()
+        failed = await slow_probe
+        return passed, failed, await client.ahealth_check()
+
+    passed, failed, after = asyncio.run(scenario())
+    assert passed["status"] == "healthy"
+    assert failed["status"] == "unhealthy"
+    assert failed["error"] == expected
+    assert after["cached"] is False
+    assert model.calls == 3
+
+
+def test_auth_failure_on_a_request_clears_cached_health(client_and_model):
+    client, model = client_and_model
+
+    async def scenario():
+        await client.ahealth_check()
+        model.outcomes = [google_exceptions.Unauthenticated("key revoked")] * 2
+        with pytest.raises(Exception):
+            await client.agenerate_response("hello")
+        return await client.ahealth_check()
+
+    health = asyncio.run(scenario())
+    assert health["status"] == "unhealthy"
+    assert health["error"] == "authentication_failed"
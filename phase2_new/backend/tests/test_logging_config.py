@@ -0,0 +1,45 @@
+"""
+Tests for secret redaction in chatbot logs
+"""
+
+import logging
+
+import pytest
+
+from chatbot.config.logging_config import JsonFormatter, RedactingFormatter, redact_secrets
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Authorization: Bearer abc.def-ghi", "Authorization: [REDACTED_AUTH]"),
+        ("Authorization: abc123", "Authorization: [REDACTED_AUTH]"),
+        ("sent Bearer abc.def-ghi upstream", "sent Bearer [REDACTED_TOKEN] upstream"),
+        ("key=AIza" + "A" * 35, "key=[REDACTED_GEMINI_KEY]"),
+        ("api_key: sk-123", "api_key: [REDACTED_KEY]"),
+        ("password=hunter2, user=bob", "password=[REDACTED_PASSWORD], user=bob"),
+        ("postgresql://bob:s3cret@db/app", "postgresql://bob:[REDACTED_DB_PASS]@db/app"),
+        ("{'access_token': 'abc', 'id': 1}", "{'access_token': '[REDACTED]', 'id': 1}"),
+    ],
+)
+def test_redact_secrets(text, expected):
+    assert redact_secrets(text) == expected
+
+
+def test_authorization_header_leaves_no_token_text():
+    redacted = redact_secrets("Authorization: Bearer abc.def-ghi")
+    assert "abc" not in redacted
+    assert "def-ghi" not in redacted
+
+
+def test_text_without_secrets_is_unchanged():
+    text = "GET /api/tasks?user_id=1 200 OK"
+    assert redact_secrets(text) is text
+
+
+def test_formatters_redact_arguments():
+    record = logging.LogRecord(
+        "chatbot", logging.INFO, __file__, 1, "headers: %s", ("Authorization: Bearer abc",), None
+    )
+    assert RedactingFormatter("%(message)s").format(record) == "headers: Authorization: [REDACTED_AUTH]"
+    assert "abc" not in JsonFormatter().format(record)
@@ -0,0 +1,34 @@
+"""
+Tests for chatbot settings loading
+"""
+
+import os
+
+import pytest
+
+from chatbot.config import settings as settings_module
+
+
+@pytest.fixture
+def fresh_settings():
+    settings_module.get_settings.cache_clear()
+    yield settings_module.get_settings
+    settings_module.get_settings.cache_clear()
+
+
+def test_dotenv_is_read_even_when_api_key_is_set(monkeypatch, fresh_settings):
+    def fake_load_dotenv(dotenv_path, override):
+        assert override is False
+        os.environ.setdefault("CHATBOT_MODEL", "model-from-dotenv")
+        os.environ.setdefault("GEMINI_API_KEY", "key-from-dotenv")
+
+    monkeypatch.setenv("GEMINI_API_KEY", "AIza" + "1" * 35)
+    monkeypatch.delenv("CHATBOT_MODEL", raising=False)
+    monkeypatch.setattr(settings_module, "load_dotenv", fake_load_dotenv)
+    try:
+        loaded = fresh_settings()
+    finally:
+        os.environ.pop("CHATBOT_MODEL", None)
+
+    assert loaded.model == "model-from-dotenv"
+    assert loaded.gemini_api_key == "AIza" + "1" * 35